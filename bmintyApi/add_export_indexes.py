@@ -86,12 +86,63 @@ def add_indexes():
             'column': 'type',
             'description': 'Speeds up filtering by cell type'
         },
+        # Composite indexes declared in signals.models Meta.indexes (same names, so they
+        # are skipped where migrations already created them)
+        {
+            'name': 'idx_signal_assay_cell',
+            'table': 'signal',
+            'column': 'assay_id, cell_id',
+            'description': 'Covers distinct-cell and signal counts per assay/study'
+        },
+        {
+            'name': 'idx_signal_assay_interval',
+            'table': 'signal',
+            'column': 'assay_id, interval_id',
+            'description': 'Covers interval lookups per assay/study'
+        },
+        {
+            'name': 'idx_cell_assay_type',
+            'table': 'cell',
+            'column': 'assay_id, type',
+            'description': 'Speeds up cell lookups by assay and cell type'
+        },
         {
             'name': 'idx_assay_study_id',
             'table': 'assay',
             'column': 'study_id',
             'description': 'Speeds up assay lookups by study'
         },
+        # Expression indexes backing the case-insensitive LOWER(col) IN (...) filters
+        {
+            'name': 'idx_study_name_lower',
+            'table': 'study',
+            'column': 'LOWER(name)',
+            'description': 'Speeds up case-insensitive filtering by study name'
+        },
+        {
+            'name': 'idx_study_external_id_lower',
+            'table': 'study',
+            'column': 'LOWER(external_id)',
+            'description': 'Speeds up case-insensitive filtering by study accession'
+        },
+        {
+            'name': 'idx_interval_type_lower',
+            'table': 'interval',
+            'column': 'LOWER(type)',
+            'description': 'Speeds up case-insensitive filtering by interval type'
+        },
+        {
+            'name': 'idx_interval_biotype_lower',
+            'table': 'interval',
+            'column': 'LOWER(biotype)',
+            'description': 'Speeds up case-insensitive filtering by biotype'
+        },
+        {
+            'name': 'idx_cell_label_lower',
+            'table': 'cell',
+            'column': 'LOWER(label)',
+            'description': 'Speeds up case-insensitive filtering by cell label'
+        },
     ]
     
     print("\n" + "="*70)
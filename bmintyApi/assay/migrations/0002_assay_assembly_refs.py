@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-16 06:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_assembly_refs(apps, schema_editor):
+    """Split every assay's `assemblies` CSV into assay_assembly rows (unknown ids skipped)."""
+    Assay = apps.get_model('assay', 'Assay')
+    Assembly = apps.get_model('assembly', 'Assembly')
+    AssayAssembly = apps.get_model('assay', 'AssayAssembly')
+    known_ids = set(Assembly.objects.values_list('id', flat=True))
+    links = []
+    for assay_id, csv_val in Assay.objects.exclude(assemblies__isnull=True).values_list('id', 'assemblies'):
+        ids = {int(tok) for tok in (t.strip() for t in csv_val.split(',')) if tok.isdigit()}
+        links.extend(
+            AssayAssembly(assay_id=assay_id, assembly_id=assembly_id)
+            for assembly_id in sorted(ids & known_ids)
+        )
+    AssayAssembly.objects.bulk_create(links, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assay', '0001_initial'),
+        ('assembly', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssayAssembly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('assay', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assembly_links', to='assay.assay')),
+                ('assembly', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assay_links', to='assembly.assembly')),
+            ],
+            options={
+                'db_table': 'assay_assembly',
+                'constraints': [models.UniqueConstraint(fields=('assay', 'assembly'), name='uniq_assay_assembly')],
+            },
+        ),
+        # A through-model M2M adds no column, but SQLite's schema editor would still
+        # rebuild the whole assay table for it, so only the state is changed
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddField(
+                    model_name='assay',
+                    name='assembly_refs',
+                    field=models.ManyToManyField(blank=True, related_name='assays', through='assay.AssayAssembly', to='assembly.assembly'),
+                ),
+            ],
+        ),
+        migrations.RunPython(populate_assembly_refs, migrations.RunPython.noop),
+    ]
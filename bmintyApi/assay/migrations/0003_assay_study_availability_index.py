@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assay', '0002_assay_assembly_refs'),
+        ('assembly', '0001_initial'),
+        ('pipelines', '0001_initial'),
+        ('studies', '0002_study_lower_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assay',
+            index=models.Index(fields=['study', 'availability'], name='idx_assay_study_avail'),
+        ),
+    ]
@@ -1,6 +1,15 @@
-from django.db import models
+from django.db import models, transaction
 from studies.models import Study
 from pipelines.models import Pipeline
+from assembly.models import Assembly
+
+
+def parse_assembly_ids(csv_val):
+    """Assembly ids listed in an Assay.assemblies CSV value (non-numeric tokens are ignored)."""
+    if not csv_val:
+        return []
+    return [int(tok) for tok in (t.strip() for t in str(csv_val).split(',')) if tok.isdigit()]
+
 
 class Assay(models.Model):
     # id → “id INTEGER PRIMARY KEY AUTOINCREMENT”
@@ -76,6 +85,14 @@ class Assay(models.Model):
         null=True,
         help_text="CSV list of assemblies used in this assay"
     )
+    # Indexed mirror of the ids in `assemblies`, so assembly filters join instead of
+    # regex-matching the CSV. Kept in sync by save() and by the raw-SQL import paths.
+    assembly_refs = models.ManyToManyField(
+        Assembly,
+        through='AssayAssembly',
+        related_name='assays',
+        blank=True,
+    )
 
     # Auto-generated metrics (set by import wizard, not user-facing inputs)
     interval_count = models.IntegerField(null=True, blank=True)
@@ -87,6 +104,46 @@ class Assay(models.Model):
     class Meta:
         db_table = 'assay'
         ordering = ['id']
+        indexes = [
+            # Covers the study list's per-study assay_count (study_id = ? AND availability)
+            models.Index(fields=['study', 'availability'], name='idx_assay_study_avail'),
+        ]
 
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if update_fields is None or 'assemblies' in update_fields:
+                self.sync_assembly_refs()
+
+    def sync_assembly_refs(self):
+        """Rebuild this assay's assembly_refs from the `assemblies` CSV (unknown ids are skipped)."""
+        self.assembly_refs.set(
+            Assembly.objects.filter(id__in=parse_assembly_ids(self.assemblies)).values_list('id', flat=True)
+        )
+
+
+class AssayAssembly(models.Model):
+    # One row per (assay, assembly id listed in Assay.assemblies)
+    assay = models.ForeignKey(
+        Assay,
+        on_delete=models.CASCADE,
+        related_name='assembly_links'
+    )
+    assembly = models.ForeignKey(
+        Assembly,
+        on_delete=models.CASCADE,
+        related_name='assay_links'
+    )
+
+    class Meta:
+        db_table = 'assay_assembly'
+        constraints = [
+            models.UniqueConstraint(fields=['assay', 'assembly'], name='uniq_assay_assembly'),
+        ]
+
+    def __str__(self):
+        return f"{self.assay_id} -> {self.assembly_id}"
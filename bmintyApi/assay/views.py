@@ -481,38 +481,33 @@ class StudyAssaysView(generics.ListCreateAPIView):
                 signals__interval__biotype__iexact=params['biotype']
             )
         
-        # Assembly filters - OPTIMIZED to use CSV assemblies field instead of expensive joins
+        # Assembly filters - join the indexed assay_assembly mirror of the assemblies CSV
         assembly_names = _get_multi_value_param(params, 'assembly_name')
         if assembly_names:
             # Look up assembly IDs matching the names
-            assembly_ids = Assembly.objects.filter(
+            assembly_ids = list(Assembly.objects.filter(
                 name__in=assembly_names
-            ).values_list('id', flat=True)
+            ).values_list('id', flat=True))
             if assembly_ids:
-                # Build regex pattern to match any of these IDs in CSV field
-                # Pattern matches: start of string, after comma, or surrounded by commas
-                id_pattern = '|'.join([f'(^{id}$|^{id},|,{id},|,{id}$)' for id in assembly_ids])
-                qs = qs.filter(assemblies__regex=id_pattern)
+                qs = qs.filter(assembly_refs__in=assembly_ids)
         
         assembly_versions = _get_multi_value_param(params, 'assembly_version')
         if assembly_versions:
             # Look up assembly IDs matching the versions
-            assembly_ids = Assembly.objects.filter(
+            assembly_ids = list(Assembly.objects.filter(
                 version__in=assembly_versions
-            ).values_list('id', flat=True)
+            ).values_list('id', flat=True))
             if assembly_ids:
-                id_pattern = '|'.join([f'(^{id}$|^{id},|,{id},|,{id}$)' for id in assembly_ids])
-                qs = qs.filter(assemblies__regex=id_pattern)
+                qs = qs.filter(assembly_refs__in=assembly_ids)
         
         assembly_species = _get_multi_value_param(params, 'assembly_species')
         if assembly_species:
             # Look up assembly IDs matching the species
-            assembly_ids = Assembly.objects.filter(
+            assembly_ids = list(Assembly.objects.filter(
                 species__in=assembly_species
-            ).values_list('id', flat=True)
+            ).values_list('id', flat=True))
             if assembly_ids:
-                id_pattern = '|'.join([f'(^{id}$|^{id},|,{id},|,{id}$)' for id in assembly_ids])
-                qs = qs.filter(assemblies__regex=id_pattern)
+                qs = qs.filter(assembly_refs__in=assembly_ids)
         # annotate counts using stored assay fields to reduce DB load
         from django.db.models import F
         from django.db.models.functions import Coalesce
@@ -0,0 +1,28 @@
+# conditional.py
+import hashlib
+
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
+
+
+def conditional_detail(queryset, lookup_field):
+    """
+    Method decorator for detail GETs: answer with 304 from an ETag that digests the row
+    the view returns, so an edited or re-imported row (import_table's INSERT OR REPLACE,
+    import_sqlite's database swap) gets a new ETag. Cache-Control: no-cache makes
+    clients revalidate every time; Vary on Accept keeps the JSON and browsable-API
+    renderings apart.
+    """
+    def etag(request, *args, **kwargs):
+        row = queryset.filter(**{lookup_field: kwargs.get(lookup_field)}).values_list().first()
+        if row is None:
+            return None
+        return hashlib.sha256(repr(row).encode()).hexdigest()[:32]
+
+    def decorate(view_func):
+        view_func = vary_on_headers('Accept')(view_func)
+        view_func = condition(etag_func=etag)(view_func)
+        return cache_control(no_cache=True)(view_func)
+    return method_decorator(decorate)
@@ -1,7 +1,73 @@
 # pagination.py
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
 
 class CustomPageNumberPagination(PageNumberPagination):
     page_size = 10  # Default
     page_size_query_param = 'page_size'
     max_page_size = 100  # Prevent abuse
+
+    # ?no_count=1 skips the SELECT COUNT(*) over the filtered queryset: the page is
+    # read with one extra row to tell whether a next page exists, and 'count' is null
+    no_count_query_param = 'no_count'
+    no_count_values = ('1', 'true', 'yes')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.no_count = (
+            request.query_params.get(self.no_count_query_param, '').lower() in self.no_count_values
+        )
+        if not self.no_count:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        # 'last' needs the count, so it is not accepted here
+        try:
+            page_number = int(request.query_params.get(self.page_query_param) or 1)
+            if page_number < 1:
+                raise ValueError
+        except ValueError:
+            raise NotFound(self.invalid_page_message)
+
+        offset = (page_number - 1) * page_size
+        rows = list(queryset[offset:offset + page_size + 1])
+        if not rows and page_number > 1:
+            raise NotFound(self.invalid_page_message)
+
+        self.page_number = page_number
+        self.has_next = len(rows) > page_size
+        return rows[:page_size]
+
+    def get_paginated_response(self, data):
+        if not self.no_count:
+            return super().get_paginated_response(data)
+        return Response({
+            'count': None,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_next_link(self):
+        if not self.no_count:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if not self.no_count:
+            return super().get_previous_link()
+        if self.page_number == 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
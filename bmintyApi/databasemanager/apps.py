@@ -1,6 +1,38 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_migrate, post_save
+
+
+def _tune_sqlite_connection(sender, connection, **kwargs):
+    # WAL lets the export builders read the main DB while requests keep writing,
+    # without rollback-journal locking. The mode is stored in the DB file, so
+    # this is a no-op after the first connection.
+    # The rest is per connection: in WAL mode synchronous=NORMAL only fsyncs at
+    # checkpoints instead of on every commit (still safe against corruption), and a
+    # 64 MiB page cache plus in-memory temp B-trees help ORM inserts and aggregates.
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA cache_size=-65536')
+            cursor.execute('PRAGMA temp_store=MEMORY')
 
 
 class DatabasemanagerConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'databasemanager'
+
+    def ready(self):
+        connection_created.connect(_tune_sqlite_connection, dispatch_uid='databasemanager_sqlite_tuning')
+
+        # Migrations can change the DDL the filtered exports copy
+        from .views import clear_export_schema_cache
+        post_migrate.connect(clear_export_schema_cache, dispatch_uid='databasemanager_export_schema')
+
+        # ORM writes to the imported data bump the data version, as the import paths do
+        from .models import _bump_after_commit
+        for model_label in ('studies.Study', 'assay.Assay', 'assembly.Assembly', 'interval.Interval',
+                            'signals.Cell', 'signals.Signal', 'pipelines.Pipeline'):
+            model = self.apps.get_model(model_label)
+            post_save.connect(_bump_after_commit, sender=model, dispatch_uid=f'data_version_save_{model_label}')
+            post_delete.connect(_bump_after_commit, sender=model, dispatch_uid=f'data_version_delete_{model_label}')
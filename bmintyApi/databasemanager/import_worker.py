@@ -0,0 +1,37 @@
+"""
+Child-process entry points for bulk imports.
+
+Kept free of model imports at module level: a spawned interpreter unpickles the
+target by importing this module, which must work before django.setup() has run.
+"""
+import csv
+
+
+def run_bulk_import(progress_queue, db_name, import_kwargs):
+    """
+    Run bulk_import_with_pandas in this process and report back over progress_queue:
+    ('progress', fields) for every progress callback, then one ('result', dict) or
+    ('error', message) message at the end.
+    """
+    import django
+    django.setup()
+    from django.conf import settings
+    # Same database as the parent, even if its settings were overridden at runtime
+    settings.DATABASES['default']['NAME'] = db_name
+    from .pandas_bulk_import import bulk_import_with_pandas
+
+    def _progress(**fields):
+        progress_queue.put(('progress', fields))
+
+    try:
+        result = bulk_import_with_pandas(progress=_progress, **import_kwargs)
+    except Exception as e:
+        progress_queue.put(('error', str(e)))
+    else:
+        progress_queue.put(('result', result))
+
+
+def write_csv_part(df, path):
+    """Write one preprocessed signal chunk as a headerless CSV part for sqlite3 .import."""
+    df.to_csv(path, index=False, header=False, na_rep='', quoting=csv.QUOTE_MINIMAL)
+    return path
@@ -1,3 +1,45 @@
-from django.db import models
+from django.db import connection, models, transaction
 
-# Create your models here.
+# Bumps the one DataVersion row in a single statement, creating it on first use.
+# Plain SQL so raw sqlite3 connections (import_sqlite, the bulk loaders) can run it too.
+DATA_VERSION_BUMP_SQL = (
+    'INSERT INTO data_version (id, version) VALUES (1, 1) '
+    'ON CONFLICT (id) DO UPDATE SET version = version + 1'
+)
+
+
+class DataVersion(models.Model):
+    """
+    Generation counter of the database contents, in a single row. The import paths and
+    ORM saves/deletes bump it, so views can tell the data changed (e.g. for an ETag)
+    without aggregating over it.
+    """
+    version = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'data_version'
+
+    def __str__(self):
+        return f"data version {self.version}"
+
+
+def current_data_version():
+    """The current data version; 0 until the first bump."""
+    return DataVersion.objects.filter(pk=1).values_list('version', flat=True).first() or 0
+
+
+def bump_data_version(cursor=None):
+    """Bump the data version on `cursor` (a DB-API cursor or connection), or Django's connection."""
+    if cursor is not None:
+        cursor.execute(DATA_VERSION_BUMP_SQL)
+        return
+    with connection.cursor() as django_cursor:
+        django_cursor.execute(DATA_VERSION_BUMP_SQL)
+
+
+def _bump_after_commit(sender, **kwargs):
+    # post_save/post_delete receiver: one bump per transaction, run once it commits
+    # (immediately in autocommit), however many rows the transaction saves
+    conn = transaction.get_connection()
+    if not any(callback[1] is bump_data_version for callback in conn.run_on_commit):
+        transaction.on_commit(bump_data_version)
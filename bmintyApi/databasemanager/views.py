@@ -10,12 +10,19 @@ import json
 import uuid
 import hashlib
 import threading
+import multiprocessing
+import queue
 import tempfile
 import time
 import traceback
 import shutil
+import logging
+import itertools
+import operator
 import numpy as np
+import pandas as pd
 from datetime import datetime
+from types import MappingProxyType
 from pathlib import Path
 from django.http import JsonResponse, FileResponse, HttpResponse
 from django.urls import reverse
@@ -26,11 +33,21 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from studies.models import Study
-from assay.models import Assay
+from assay.models import Assay, parse_assembly_ids
 from signals.models import Signal, Cell
 from interval.models import Interval
 from assembly.models import Assembly
-from .pandas_bulk_import import bulk_import_with_pandas
+from studies.filters import iexact_any
+from .import_worker import run_bulk_import
+from .models import bump_data_version
+
+# orjson parses large ID maps several times faster than stdlib json; it stays optional
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
 
 # Define paths
 BASE_DIR = Path(settings.BASE_DIR)
@@ -39,8 +56,8 @@ EXPORT_FOLDER = BASE_DIR / 'exports'
 UPLOAD_FOLDER.mkdir(exist_ok=True)
 EXPORT_FOLDER.mkdir(exist_ok=True)
 
-# Tables we allow exporting individually
-EXPORT_TABLES = [
+# Tables we allow exporting individually (ordered: Swagger enum, messages, ZIP layout)
+EXPORT_TABLE_NAMES = (
     'assay',
     'assembly',
     'cell',
@@ -48,7 +65,142 @@ EXPORT_TABLES = [
     'pipeline',
     'signal',
     'study',
-]
+)
+# Set form for O(1) membership checks
+EXPORT_TABLES = frozenset(EXPORT_TABLE_NAMES)
+
+# ZIP archives are built in RAM up to this size, then spill to a temp file on disk
+ZIP_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+# Deflate level for the text (CSV/JSON) entries: level 1 costs about half the CPU of the
+# default 6 for a few percent more bytes on CSV
+ZIP_COMPRESSLEVEL = 1
+# Chunk size used when streaming large files into ZIP entries
+COPY_BUFFER_SIZE = 1 << 20
+# Rows per executemany call when importing CSV tables
+IMPORT_BATCH_SIZE = 10000
+# mmap cap for read-heavy export connections (SQLite never maps past the file size);
+# a 32-bit address space cannot map a large DB, so mmap stays off there
+SQLITE_MMAP_SIZE = 1 << 40 if sys.maxsize > 2**32 else 0
+# Helper threads SQLite may use for the large sorts in the filtered-export builders
+# (ORDER BY on the signal copy, CREATE INDEX after the bulk load)
+SQLITE_SORT_THREADS = min(4, os.cpu_count() or 1)
+
+# Minimal Django core tables that imported databases typically lack, created in one
+# transaction (one journal flush) by import_sqlite before faking migrations.
+_DJANGO_CORE_DDL = """
+PRAGMA foreign_keys = OFF;
+BEGIN;
+CREATE TABLE IF NOT EXISTS django_migrations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    app VARCHAR(255) NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    applied DATETIME NOT NULL
+);
+CREATE TABLE IF NOT EXISTS django_content_type (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    app_label VARCHAR(100) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    UNIQUE (app_label, model)
+);
+CREATE TABLE IF NOT EXISTS auth_permission (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    content_type_id INTEGER NOT NULL,
+    codename VARCHAR(100) NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    UNIQUE (content_type_id, codename)
+);
+CREATE TABLE IF NOT EXISTS auth_group (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(150) NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS auth_group_permissions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    group_id INTEGER NOT NULL,
+    permission_id INTEGER NOT NULL,
+    UNIQUE (group_id, permission_id)
+);
+CREATE TABLE IF NOT EXISTS auth_user (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    password VARCHAR(128) NOT NULL,
+    last_login DATETIME,
+    is_superuser BOOLEAN NOT NULL,
+    username VARCHAR(150) NOT NULL UNIQUE,
+    last_name VARCHAR(150) NOT NULL,
+    email VARCHAR(254) NOT NULL,
+    is_staff BOOLEAN NOT NULL,
+    is_active BOOLEAN NOT NULL,
+    date_joined DATETIME NOT NULL,
+    first_name VARCHAR(150) NOT NULL
+);
+CREATE TABLE IF NOT EXISTS auth_user_groups (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    group_id INTEGER NOT NULL,
+    UNIQUE (user_id, group_id)
+);
+CREATE TABLE IF NOT EXISTS auth_user_user_permissions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    permission_id INTEGER NOT NULL,
+    UNIQUE (user_id, permission_id)
+);
+CREATE TABLE IF NOT EXISTS django_admin_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    action_time DATETIME NOT NULL,
+    object_id TEXT,
+    object_repr VARCHAR(200) NOT NULL,
+    change_message TEXT NOT NULL,
+    content_type_id INTEGER,
+    user_id INTEGER NOT NULL,
+    action_flag SMALLINT UNSIGNED NOT NULL
+);
+CREATE TABLE IF NOT EXISTS django_session (
+    session_key VARCHAR(40) NOT NULL PRIMARY KEY,
+    session_data TEXT NOT NULL,
+    expire_date DATETIME NOT NULL
+);
+COMMIT;
+"""
+
+# assay_assembly as created by assay/migrations/0002. import_sqlite fakes migrations, so an
+# uploaded database from before that migration gets the table (and its indexes) here.
+_ASSAY_ASSEMBLY_DDL = (
+    'CREATE TABLE IF NOT EXISTS "assay_assembly" ('
+    '"id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, '
+    '"assay_id" bigint NOT NULL REFERENCES "assay" ("id") DEFERRABLE INITIALLY DEFERRED, '
+    '"assembly_id" bigint NOT NULL REFERENCES "assembly" ("id") DEFERRABLE INITIALLY DEFERRED, '
+    'CONSTRAINT "uniq_assay_assembly" UNIQUE ("assay_id", "assembly_id"))',
+    'CREATE INDEX IF NOT EXISTS "assay_assembly_assay_id_bca25dc2" ON "assay_assembly" ("assay_id")',
+    'CREATE INDEX IF NOT EXISTS "assay_assembly_assembly_id_e44cb27b" ON "assay_assembly" ("assembly_id")',
+)
+
+# Study-list indexes from studies/migrations/0002 and assay/migrations/0003, likewise
+# missing from uploaded databases
+_STUDY_INDEX_DDL = (
+    'CREATE INDEX IF NOT EXISTS "idx_study_name_lower" ON "study" ((LOWER("name")))',
+    'CREATE INDEX IF NOT EXISTS "idx_study_external_id_lower" ON "study" ((LOWER("external_id")))',
+    'CREATE INDEX IF NOT EXISTS "idx_assay_study_avail" ON "assay" ("study_id", "availability")',
+)
+
+# Composite cell/signal indexes from signals/migrations/0002, which the study list's and
+# explore view's EXISTS filters probe; likewise missing from uploaded databases
+_SIGNAL_INDEX_DDL = (
+    'CREATE INDEX IF NOT EXISTS "idx_cell_assay_type" ON "cell" ("assay_id", "type")',
+    'CREATE INDEX IF NOT EXISTS "idx_signal_assay_cell" ON "signal" ("assay_id", "cell_id")',
+    'CREATE INDEX IF NOT EXISTS "idx_signal_assay_interval" ON "signal" ("assay_id", "interval_id")',
+)
+
+# data_version as created by databasemanager/migrations/0001, for uploaded databases
+# that predate it. After an upload the version is set past both the replaced
+# database's and the upload's own, so no version (or ETag built on it) repeats.
+_DATA_VERSION_DDL = (
+    'CREATE TABLE IF NOT EXISTS "data_version" '
+    '("id" integer NOT NULL PRIMARY KEY AUTOINCREMENT, "version" bigint NOT NULL)'
+)
+_DATA_VERSION_AFTER_UPLOAD_SQL = (
+    'INSERT INTO data_version (id, version) VALUES (1, ?) '
+    'ON CONFLICT (id) DO UPDATE SET version = max(version + 1, excluded.version)'
+)
 
 # In-memory progress store for bulk imports (single-process). For production, use Redis or a DB-backed cache.
 PROGRESS_STORE = {}
@@ -64,15 +216,6 @@ def _parse_bool_param(val):
         return False
     return None
 
-def _batch_iter(iterable, batch_size):
-    """
-    Generator that yields batches from an iterable.
-    Useful for batching large ID lists to avoid SQLite's 999 variable limit.
-    """
-    items = list(iterable) if not isinstance(iterable, list) else iterable
-    for i in range(0, len(items), batch_size):
-        yield items[i:i + batch_size]
-
 def _compute_sha256_file(file_path):
     """Compute SHA-256 checksum of a file on disk using chunked reading (efficient, ~64KB RAM)."""
     h = hashlib.sha256()
@@ -96,6 +239,109 @@ def _compute_sha256_bytes(data):
         h.update(data)
     return h.hexdigest()
 
+def _write_file_to_zip(zf, src_path, arcname, compress_type=zipfile.ZIP_STORED):
+    """
+    Stream a file from disk into a ZIP entry in 1MB chunks instead of reading it whole.
+    Stored uncompressed by default: SQLite files are packed B-tree pages that deflate
+    poorly for a lot of CPU.
+    """
+    info = zipfile.ZipInfo(arcname, date_time=time.localtime()[:6])
+    info.compress_type = compress_type
+    info.external_attr = 0o600 << 16
+    with zf.open(info, 'w', force_zip64=True) as entry, open(src_path, 'rb') as src:
+        shutil.copyfileobj(src, entry, length=COPY_BUFFER_SIZE)
+
+def _open_for_streaming(path):
+    """
+    Open a file for a FileResponse; returns (file, size) both taken from one fd, so the
+    Content-Length always matches what is streamed even if the path is unlinked meanwhile.
+    """
+    noatime = getattr(os, 'O_NOATIME', 0)  # Linux: skip the atime inode write
+    flags = os.O_RDONLY | noatime | getattr(os, 'O_CLOEXEC', 0)
+    try:
+        fd = os.open(path, flags)
+    except PermissionError:
+        # O_NOATIME is only allowed on files we own
+        fd = os.open(path, flags & ~noatime)
+    size = os.fstat(fd).st_size
+    return os.fdopen(fd, 'rb', buffering=COPY_BUFFER_SIZE), size
+
+def _save_upload_to_temp(uploaded, suffix='.csv'):
+    """
+    Give an uploaded file a temp path that outlives the request; returns the path.
+    Uploads Django already spooled to disk get a second hard link, so the data is not
+    written again at all (Django only unlinks its own name when the request ends).
+    Across filesystems they are copied in-kernel (shutil.copyfile uses sendfile on
+    Linux); in-memory ones are written in COPY_BUFFER_SIZE chunks.
+    """
+    if hasattr(uploaded, 'temporary_file_path'):
+        spooled_path = uploaded.temporary_file_path()
+        linked_path = f"{spooled_path}.{uuid.uuid4().hex}{suffix}"
+        try:
+            os.link(spooled_path, linked_path)
+            return linked_path
+        except OSError:
+            pass
+    with tempfile.NamedTemporaryFile(mode='wb', suffix=suffix, delete=False) as dst:
+        if hasattr(uploaded, 'temporary_file_path'):
+            dst.close()
+            shutil.copyfile(uploaded.temporary_file_path(), dst.name)
+        else:
+            for chunk in uploaded.chunks(chunk_size=COPY_BUFFER_SIZE):
+                dst.write(chunk)
+    return dst.name
+
+def _write_ro_crate_to_zip(zf, ro_crate):
+    """
+    Write RO-Crate metadata into the ZIP. Serialized in one shot rather than streamed:
+    json's C encoder only runs for dumps() without indent (json.dump always goes through
+    the pure-Python encoder), and the metadata is small next to the data entries.
+    Indented only under DEBUG.
+    """
+    if settings.DEBUG:
+        payload = json.dumps(ro_crate, indent=2)
+    else:
+        payload = json.dumps(ro_crate, separators=(',', ':'))
+    zf.writestr('ro-crate-metadata.json', payload)
+
+def _snapshot_sqlite_db(db_path):
+    """
+    Take a consistent snapshot of a live (possibly WAL-mode) SQLite database into a temp file.
+    The WAL is checkpointed first, then copied with the online backup API so pages still
+    sitting in the -wal sidecar are included. Returns the snapshot path; caller deletes it.
+    """
+    fd, snapshot_path = tempfile.mkstemp(suffix='.sqlite3')
+    os.close(fd)
+    src = sqlite3.connect(str(db_path))
+    dst = sqlite3.connect(snapshot_path)
+    try:
+        src.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        src.backup(dst)
+        # Exported file must be self-contained (no -wal sidecar expected next to it)
+        dst.execute('PRAGMA journal_mode=DELETE')
+    except Exception:
+        dst.close()
+        os.unlink(snapshot_path)
+        raise
+    finally:
+        dst.close()
+        src.close()
+    return snapshot_path
+
+def _read_data_version(db_path):
+    """The data version stored in the SQLite file at db_path; 0 if it has none."""
+    if not Path(db_path).exists():
+        return 0
+    conn = sqlite3.connect(str(db_path))
+    try:
+        row = conn.execute('SELECT version FROM data_version WHERE id = 1').fetchone()
+    except sqlite3.OperationalError:
+        # A database from before the data_version table
+        row = None
+    finally:
+        conn.close()
+    return row[0] if row else 0
+
 def _get_multi_value_param(query_params, param_name):
     """
     Get parameter values, handling multiple formats:
@@ -149,6 +395,27 @@ def _count_csv_rows_from_file(uploaded_file):
         return 0
 
 
+def _rebuild_assay_assembly_refs(conn):
+    """
+    Refill assay_assembly from every assay's `assemblies` CSV over a raw sqlite3
+    connection, for writers that bypass Assay.save(). Ids with no assembly row are
+    skipped, as in Assay.sync_assembly_refs. Runs in the caller's transaction.
+    """
+    for ddl in _ASSAY_ASSEMBLY_DDL:
+        conn.execute(ddl)
+    known_ids = {row[0] for row in conn.execute('SELECT id FROM assembly')}
+    assay_rows = conn.execute('SELECT id, assemblies FROM assay WHERE assemblies IS NOT NULL').fetchall()
+    conn.execute('DELETE FROM assay_assembly')
+    conn.executemany(
+        'INSERT INTO assay_assembly (assay_id, assembly_id) VALUES (?, ?)',
+        (
+            (assay_id, assembly_id)
+            for assay_id, csv_val in assay_rows
+            for assembly_id in sorted(set(parse_assembly_ids(csv_val)) & known_ids)
+        ),
+    )
+
+
 def _update_progress(job_id, **fields):
     with PROGRESS_LOCK:
         if job_id not in PROGRESS_STORE:
@@ -628,6 +895,49 @@ def _generate_ro_crate_metadata(query_params, counts, file_list, export_format='
     return ro_crate
 
 
+def _set_import_pragmas():
+    """
+    Relax SQLite durability on Django's connection for the duration of a CSV import
+    (the data is being rewritten anyway). Returns the previous settings for
+    _restore_import_pragmas. Must run outside a transaction.
+
+    A WAL database keeps its journal mode: leaving WAL would need exclusive access
+    and would undo the mode the connection setup in databasemanager.apps chose.
+    """
+    from django.db import connection
+    with connection.cursor() as c:
+        c.execute('PRAGMA synchronous')
+        synchronous = c.fetchone()[0]
+        c.execute('PRAGMA journal_mode')
+        journal_mode = c.fetchone()[0]
+        c.execute('PRAGMA temp_store')
+        temp_store = c.fetchone()[0]
+    saved = synchronous, journal_mode, temp_store
+    try:
+        with connection.cursor() as c:
+            c.execute('PRAGMA synchronous=OFF')
+            if journal_mode.lower() != 'wal':
+                c.execute('PRAGMA journal_mode=MEMORY')
+            c.execute('PRAGMA temp_store=MEMORY')
+    except Exception:
+        _restore_import_pragmas(saved)
+        raise
+    return saved
+
+
+def _restore_import_pragmas(saved):
+    """Restore the settings captured by _set_import_pragmas (a no-op for None)."""
+    if saved is None:
+        return
+    from django.db import connection
+    synchronous, journal_mode, temp_store = saved
+    with connection.cursor() as c:
+        c.execute(f'PRAGMA synchronous={int(synchronous)}')
+        if journal_mode.lower() != 'wal':
+            c.execute(f'PRAGMA journal_mode={journal_mode}')
+        c.execute(f'PRAGMA temp_store={int(temp_store)}')
+
+
 def _import_interval(request, rows):
     """
     Import intervals with ID mapping:
@@ -663,7 +973,9 @@ def _import_interval(request, rows):
     
     from django.db import transaction
     
+    saved_pragmas = None
     try:
+        saved_pragmas = _set_import_pragmas()
         with transaction.atomic():
             for row in rows:
                 external_id = row.get('external_id', '').strip()
@@ -719,6 +1031,8 @@ def _import_interval(request, rows):
         
     except Exception as e:
         return JsonResponse({"error": f"Failed to import intervals: {str(e)}"}, status=500)
+    finally:
+        _restore_import_pragmas(saved_pragmas)
 
 
 def _import_cell(request, rows):
@@ -752,7 +1066,9 @@ def _import_cell(request, rows):
     
     from django.db import transaction
     
+    saved_pragmas = None
     try:
+        saved_pragmas = _set_import_pragmas()
         with transaction.atomic():
             for row in rows:
                 name = (row.get('name') or '').strip()
@@ -804,6 +1120,8 @@ def _import_cell(request, rows):
         
     except Exception as e:
         return JsonResponse({"error": f"Failed to import cells: {str(e)}"}, status=500)
+    finally:
+        _restore_import_pragmas(saved_pragmas)
 
 
 def _import_signal(request, rows):
@@ -834,101 +1152,140 @@ def _import_signal(request, rows):
             return JsonResponse({"error": f"Assay with id {assay_id} not found."}, status=400)
         
         # Parse ID maps
-        interval_id_map = json.loads(interval_id_map_json) if isinstance(interval_id_map_json, str) else interval_id_map_json
-        cell_name_map = json.loads(cell_name_map_json) if isinstance(cell_name_map_json, str) else cell_name_map_json
+        interval_id_map = _json_loads(interval_id_map_json) if isinstance(interval_id_map_json, str) else interval_id_map_json
+        cell_name_map = _json_loads(cell_name_map_json) if isinstance(cell_name_map_json, str) else cell_name_map_json
         
     except (ValueError, TypeError) as e:
         return JsonResponse({"error": f"Invalid parameters: {str(e)}"}, status=400)
 
-    row_count = 0
+    # Normalize numeric values for European formats
+    def _norm_num(s):
+        s = (s or '').strip()
+        if not s:
+            raise ValueError('Empty numeric value')
+        # OPTIMIZATION: plain ASCII floats (the common case) skip the format fixups below
+        c = s[0]
+        if ('0' <= c <= '9' or c in '-+.') and ',' not in s and ' ' not in s:
+            try:
+                return float(s)
+            except ValueError:
+                pass
+        if s.upper() in ('NA','N/A','NULL'):
+            raise ValueError('Null numeric value')
+        s = s.replace(' ', '')
+        if ',' in s:
+            s = s.replace('.', '')
+            s = s.replace(',', '.')
+            return float(s)
+        if s.count('.') > 1:
+            s = s.replace('.', '')
+            return float(s)
+        return float(s)
+
+    # Parse a whole numeric column at once: the C-level float() over the column handles
+    # the common case, and only a column that fails falls back to per-value normalization.
+    # Blank or unparsable values become None.
+    def _parse_float_column(values):
+        try:
+            return [float(v) if v else None for v in values]
+        except ValueError:
+            pass
+        parsed = []
+        for v in values:
+            try:
+                parsed.append(_norm_num(v) if v else None)
+            except ValueError:
+                parsed.append(None)
+        return parsed
+
+    # First pass: collect the key and raw numeric columns of rows with a signal and interval
+    interval_keys, cell_keys = [], []
+    signal_raw, p_value_raw, padj_value_raw = [], [], []
+    for row in rows:
+        signal_val = row.get('signal', '').strip()
+        csv_interval_id = row.get('interval_id', '').strip()
+        
+        if not signal_val or not csv_interval_id:
+            continue  # Skip invalid rows
+        
+        interval_keys.append(csv_interval_id)
+        cell_keys.append(row.get('cell_id', '').strip())
+        signal_raw.append(signal_val)
+        p_value_raw.append(row.get('p_value', '').strip())
+        padj_value_raw.append(row.get('padj_value', '').strip())
+
+    # Resolve each key column in one map(dict.get) pass (the loop runs in C), then retry
+    # only the misses as integer keys. interval_id_map is keyed by interval external_id,
+    # cell_name_map by cell name.
+    def _resolve_ids(keys, id_map):
+        ids = list(map(id_map.get, keys))
+        for i in itertools.filterfalse(ids.__getitem__, range(len(ids))):
+            if keys[i].isdigit():
+                ids[i] = id_map.get(int(keys[i]))
+        return ids
+
+    interval_ids = _resolve_ids(interval_keys, interval_id_map)
+    cell_ids = _resolve_ids(cell_keys, cell_name_map)
+    if '' in cell_name_map:
+        # A blank cell_id means "no cell", never a lookup
+        cell_ids = [db_id if key else None for key, db_id in zip(cell_keys, cell_ids)]
+    
+    # Skip rows whose interval is not in the map
+    pending = list(zip(interval_ids, cell_ids))
+    if not all(interval_ids):
+        keep = [bool(db_id) for db_id in interval_ids]
+        pending = list(itertools.compress(pending, keep))
+        signal_raw = list(itertools.compress(signal_raw, keep))
+        p_value_raw = list(itertools.compress(p_value_raw, keep))
+        padj_value_raw = list(itertools.compress(padj_value_raw, keep))
+
+    signals = _parse_float_column(signal_raw)
+    p_values = _parse_float_column(p_value_raw)
+    padj_values = _parse_float_column(padj_value_raw)
+
+    # Rows whose signal is not numeric are skipped; the rest are already validated,
+    # so Signal.clean() has nothing left to normalize and the ORM can be bypassed
+    signal_rows = [
+        (signal, p_value, padj_value, assay_id, interval_db_id, cell_db_id)
+        for (interval_db_id, cell_db_id), signal, p_value, padj_value in zip(
+            pending, signals, p_values, padj_values
+        )
+        if signal is not None
+    ]
+    row_count = len(signal_rows)
     
-    from django.db import transaction
+    from django.db import connection, transaction
     
+    saved_pragmas = None
     try:
+        saved_pragmas = _set_import_pragmas()
         with transaction.atomic():
-            for row in rows:
-                signal_val = row.get('signal', '').strip()
-                p_value_val = row.get('p_value', '').strip()
-                padj_value_val = row.get('padj_value', '').strip()
-                csv_interval_id = row.get('interval_id', '').strip()
-                csv_cell_id = row.get('cell_id', '').strip()
-                
-                if not signal_val or not csv_interval_id:
-                    continue  # Skip invalid rows
-                
-                # Normalize numeric values for European formats
-                def _norm_num(s):
-                    s = (s or '').strip()
-                    if not s:
-                        raise ValueError('Empty numeric value')
-                    if s.upper() in ('NA','N/A','NULL'):
-                        raise ValueError('Null numeric value')
-                    s = s.replace(' ', '')
-                    if ',' in s:
-                        s = s.replace('.', '')
-                        s = s.replace(',', '.')
-                        return float(s)
-                    if s.count('.') > 1:
-                        s = s.replace('.', '')
-                        return float(s)
-                    return float(s)
-
-                try:
-                    signal = _norm_num(signal_val)
-                except ValueError:
-                    continue
-                try:
-                    p_value = _norm_num(p_value_val) if p_value_val else None
-                except ValueError:
-                    p_value = None
-                try:
-                    padj_value = _norm_num(padj_value_val) if padj_value_val else None
-                except ValueError:
-                    padj_value = None
-                
-                # Map interval_id from CSV to new DB ID
-                # The map key is the external_id from interval CSV
-                interval_db_id = interval_id_map.get(csv_interval_id)
-                if not interval_db_id:
-                    # Try as integer key
-                    interval_db_id = interval_id_map.get(int(csv_interval_id)) if csv_interval_id.isdigit() else None
-                
-                if not interval_db_id:
-                    continue  # Skip if interval not found in map
-                
-                # Map cell_id from CSV (could be cell name) to new DB ID
-                cell_db_id = None
-                if csv_cell_id:
-                    cell_db_id = cell_name_map.get(csv_cell_id)
-                    if not cell_db_id and csv_cell_id.isdigit():
-                        cell_db_id = cell_name_map.get(int(csv_cell_id))
-                
-                # Create signal with mapped IDs
-                try:
-                    Signal.objects.create(
-                        signal=signal,
-                        p_value=p_value,
-                        padj_value=padj_value,
-                        assay_id=assay_id,
-                        interval_id=interval_db_id,
-                        cell_id=cell_db_id
-                    )
-                except Exception as e:
-                    try:
-                        with open('/tmp/bulk_import_debug.log', 'a') as dbg:
-                            dbg.write(f"create error row: {row} err: {e}\n")
-                    except Exception:
-                        pass
-                    raise
-                
-                row_count += 1
+            # OPTIMIZATION: one prepared INSERT for all rows instead of Signal.objects.create per row
+            with connection.cursor() as cursor:
+                cursor.executemany(
+                    'INSERT INTO signal (signal, p_value, padj_value, assay_id, interval_id, cell_id) '
+                    'VALUES (%s, %s, %s, %s, %s, %s)',
+                    signal_rows
+                )
+                bump_data_version(cursor)
         
             return JsonResponse({
                 "message": f"Imported {row_count} signal(s)."
             })
         
     except Exception as e:
+        logger.exception("Signal import of %d row(s) rolled back", row_count)
         return JsonResponse({"error": f"Failed to import signals: {str(e)}"}, status=500)
+    finally:
+        _restore_import_pragmas(saved_pragmas)
+
+
+# Tables whose CSV import remaps IDs instead of using the generic upsert in import_table
+_SPECIAL_IMPORTERS = {
+    'interval': _import_interval,
+    'cell': _import_cell,
+    'signal': _import_signal,
+}
 
 
 @swagger_auto_schema(
@@ -948,11 +1305,12 @@ def _import_signal(request, rows):
     - Must be a .sqlite3 file
     
     Import Process (Optimized for Speed):
-    1. (Optional) Backup current database with .backup extension
-    2. Delete existing database
-    3. Copy incoming database directly (native SQLite file)
-    4. Create django_migrations table if missing
-    5. Apply migrations with --fake-initial (creates missing Django tables, preserves existing data)
+    1. Upload is written next to the current database and checked to be readable by SQLite
+    2. (Optional) Backup current database with .backup extension
+    3. Delete existing database
+    4. Rename incoming database into place (no copy)
+    5. Create django_migrations table if missing
+    6. Apply migrations with --fake-initial (creates missing Django tables, preserves existing data)
     
     This is the FASTEST import method:
     - No schema validation
@@ -1015,149 +1373,61 @@ def import_sqlite(request):
         # Get backup option: 'true' or 'false' (default: 'true')
         create_backup = request.POST.get('create_backup', 'true').lower() in ['true', '1', 'yes']
 
-        # Save upload to temp location
-        save_path = UPLOAD_FOLDER / sqlite_file.name
-        with save_path.open('wb') as f:
+        current_db_path = Path(settings.DATABASES['default']['NAME'])
+
+        # Save upload next to the DB so it can be renamed into place (same filesystem, no second copy)
+        upload_path = current_db_path.with_name(current_db_path.name + '.uploading')
+        with upload_path.open('wb') as f:
             for chunk in sqlite_file.chunks():
                 f.write(chunk)
 
+        # Reject files SQLite cannot read before touching the current database
+        try:
+            conn = sqlite3.connect(str(upload_path))
+            try:
+                conn.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()
+            finally:
+                conn.close()
+        except sqlite3.DatabaseError as e:
+            upload_path.unlink(missing_ok=True)
+            return JsonResponse({"error": f"Invalid SQLite database: {str(e)}"}, status=400)
+
         # Backup existing DB if requested
-        current_db_path = Path(settings.DATABASES['default']['NAME'])
         backup_path = None
         if create_backup and current_db_path.exists():
             backup_path = current_db_path.with_name(current_db_path.name + '.backup')
-            shutil.copy2(str(current_db_path), str(backup_path))
+            # A file copy would miss committed pages still in the -wal sidecar, which is
+            # deleted below; the snapshot checkpoints and goes through the backup API
+            shutil.move(_snapshot_sqlite_db(current_db_path), str(backup_path))
+
+        replaced_version = _read_data_version(current_db_path)
 
         try:
-            # Delete existing DB
+            # Delete existing DB (and any WAL sidecars, which must not be replayed into the new file)
             if current_db_path.exists():
                 current_db_path.unlink()
+            for suffix in ('-wal', '-shm'):
+                Path(str(current_db_path) + suffix).unlink(missing_ok=True)
             
-            # Copy incoming database directly (fastest method)
-            shutil.copy2(str(save_path), str(current_db_path))
-            
-            # Clean up uploaded temp file
-            save_path.unlink()
+            # Move the upload into place (atomic rename, no copy)
+            os.replace(upload_path, current_db_path)
+            clear_export_schema_cache()
             
             # Manually create Django core tables without constraint checks
             # This avoids Django's migration system which enforces foreign key constraints
             conn = sqlite3.connect(str(current_db_path))
             try:
-                conn.execute('PRAGMA foreign_keys = OFF')
-                
-                # Create django_migrations table
-                conn.execute('''
-                    CREATE TABLE IF NOT EXISTS django_migrations (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        app VARCHAR(255) NOT NULL,
-                        name VARCHAR(255) NOT NULL,
-                        applied DATETIME NOT NULL
-                    )
-                ''')
-                
-                # Create other essential Django tables that are typically missing from imported databases
-                # These are minimal schemas - enough for Django to function
-                
-                # django_content_type - Required for Django's ContentType framework
-                conn.execute('''
-                    CREATE TABLE IF NOT EXISTS django_content_type (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        app_label VARCHAR(100) NOT NULL,
-                        model VARCHAR(100) NOT NULL,
-                        UNIQUE (app_label, model)
-                    )
-                ''')
-                
-                # auth_permission - Required for Django's permissions system
-                conn.execute('''
-                    CREATE TABLE IF NOT EXISTS auth_permission (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        content_type_id INTEGER NOT NULL,
-                        codename VARCHAR(100) NOT NULL,
-                        name VARCHAR(255) NOT NULL,
-                        UNIQUE (content_type_id, codename)
-                    )
-                ''')
-                
-                # auth_group - Required for Django's group permissions
-                conn.execute('''
-                    CREATE TABLE IF NOT EXISTS auth_group (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        name VARCHAR(150) NOT NULL UNIQUE
-                    )
-                ''')
-                
-                # auth_group_permissions - Many-to-many table
-                conn.execute('''
-                    CREATE TABLE IF NOT EXISTS auth_group_permissions (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        group_id INTEGER NOT NULL,
-                        permission_id INTEGER NOT NULL,
-                        UNIQUE (group_id, permission_id)
-                    )
-                ''')
-                
-                # auth_user - Required for Django's authentication
-                conn.execute('''
-                    CREATE TABLE IF NOT EXISTS auth_user (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        password VARCHAR(128) NOT NULL,
-                        last_login DATETIME,
-                        is_superuser BOOLEAN NOT NULL,
-                        username VARCHAR(150) NOT NULL UNIQUE,
-                        last_name VARCHAR(150) NOT NULL,
-                        email VARCHAR(254) NOT NULL,
-                        is_staff BOOLEAN NOT NULL,
-                        is_active BOOLEAN NOT NULL,
-                        date_joined DATETIME NOT NULL,
-                        first_name VARCHAR(150) NOT NULL
-                    )
-                ''')
-                
-                # auth_user_groups - Many-to-many table
-                conn.execute('''
-                    CREATE TABLE IF NOT EXISTS auth_user_groups (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id INTEGER NOT NULL,
-                        group_id INTEGER NOT NULL,
-                        UNIQUE (user_id, group_id)
-                    )
-                ''')
-                
-                # auth_user_user_permissions - Many-to-many table
-                conn.execute('''
-                    CREATE TABLE IF NOT EXISTS auth_user_user_permissions (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id INTEGER NOT NULL,
-                        permission_id INTEGER NOT NULL,
-                        UNIQUE (user_id, permission_id)
-                    )
-                ''')
-                
-                # django_admin_log - For admin interface
-                conn.execute('''
-                    CREATE TABLE IF NOT EXISTS django_admin_log (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        action_time DATETIME NOT NULL,
-                        object_id TEXT,
-                        object_repr VARCHAR(200) NOT NULL,
-                        change_message TEXT NOT NULL,
-                        content_type_id INTEGER,
-                        user_id INTEGER NOT NULL,
-                        action_flag SMALLINT UNSIGNED NOT NULL
-                    )
-                ''')
-                
-                # django_session - For session management
-                conn.execute('''
-                    CREATE TABLE IF NOT EXISTS django_session (
-                        session_key VARCHAR(40) NOT NULL PRIMARY KEY,
-                        session_data TEXT NOT NULL,
-                        expire_date DATETIME NOT NULL
-                    )
-                ''')
-                
-                conn.commit()
+                # WAL mode so subsequent writes are faster
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.executescript(_DJANGO_CORE_DDL)
+                # Faked migrations create nothing: rebuild the assembly join table
+                # and add the study lookup and cell/signal indexes
+                with conn:
+                    _rebuild_assay_assembly_refs(conn)
+                    for ddl in (*_STUDY_INDEX_DDL, *_SIGNAL_INDEX_DDL):
+                        conn.execute(ddl)
+                    conn.execute(_DATA_VERSION_DDL)
+                    conn.execute(_DATA_VERSION_AFTER_UPLOAD_SQL, (replaced_version + 1,))
             finally:
                 conn.close()
             
@@ -1183,11 +1453,12 @@ def import_sqlite(request):
             if backup_path and backup_path.exists():
                 if current_db_path.exists():
                     current_db_path.unlink()
+                for suffix in ('-wal', '-shm'):
+                    Path(str(current_db_path) + suffix).unlink(missing_ok=True)
                 shutil.copy2(str(backup_path), str(current_db_path))
             
-            # Clean up uploaded file
-            if save_path.exists():
-                save_path.unlink()
+            # Clean up uploaded file if it was never moved into place
+            upload_path.unlink(missing_ok=True)
             
             return JsonResponse(
                 {"error": f"Database import failed: {str(e)}", "traceback": traceback.format_exc()},
@@ -1196,43 +1467,60 @@ def import_sqlite(request):
 
     return JsonResponse({"error": "No file uploaded."}, status=400)
 
-def _dump_table_csv(db_path, table_name):
+def _open_export_reader(db_path):
+    """Open a connection for dumping every table of an export DB in turn."""
+    conn = sqlite3.connect(db_path)
+    conn.execute(f'PRAGMA mmap_size={SQLITE_MMAP_SIZE}')
+    conn.execute('PRAGMA cache_size=-128000')
+    return conn
+
+
+def _dump_table_csv(db_path_or_conn, table_name, target=None):
     """
     Export table as CSV format.
-    Returns a string containing CSV data with headers.
+    Streams rows into the file-like `target`; without a target,
+    returns the CSV data with headers as UTF-8 bytes.
+    
+    Pass an open connection to dump several tables without reopening the DB.
     """
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    if target is None:
+        # Encode while writing so the response body and its checksum share one
+        # bytes object instead of each re-encoding a str
+        raw = io.BytesIO()
+        output = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+    else:
+        output = target
+    if isinstance(db_path_or_conn, sqlite3.Connection):
+        conn = db_path_or_conn
+        should_close = False
+    else:
+        conn = sqlite3.connect(db_path_or_conn)
+        should_close = True
     cursor = conn.cursor()
     
     try:
-        # Get all rows
         cursor.execute(f'SELECT * FROM "{table_name}"')
-        rows = cursor.fetchall()
-        
-        if not rows:
-            # Empty table - just return headers
-            cursor.execute(f'PRAGMA table_info("{table_name}")')
-            columns = [col[1] for col in cursor.fetchall()]
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(columns)
-            return output.getvalue()
-        
-        # Get column names from first row
-        columns = rows[0].keys()
-        
-        # Write CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(columns)
-        
-        for row in rows:
-            writer.writerow([row[col] for col in columns])
-        
-        return output.getvalue()
+        writer = csv.writer(output, quoting=csv.QUOTE_MINIMAL)
+        # Column names come from the cursor, so empty tables still get headers
+        writer.writerow([col[0] for col in cursor.description])
+        # Plain tuples, consumed by the C writer straight off the cursor
+        writer.writerows(cursor)
+        
+        if target is None:
+            output.flush()
+            return raw.getvalue()
+        return None
     finally:
-        conn.close()
+        cursor.close()
+        if should_close:
+            conn.close()
+
+
+def _write_table_csv_to_zip(zf, db_path_or_conn, table_name, arcname):
+    """Stream a table as CSV straight into a ZIP entry without building the CSV in memory."""
+    with zf.open(arcname, 'w', force_zip64=True) as entry:
+        with io.TextIOWrapper(entry, encoding='utf-8', newline='') as text:
+            _dump_table_csv(db_path_or_conn, table_name, text)
 
 @swagger_auto_schema(
     method='get',
@@ -1276,7 +1564,7 @@ def _dump_table_csv(db_path, table_name):
             openapi.IN_QUERY,
             type=openapi.TYPE_STRING,
             description="Table name to export (study, assay, interval, assembly, signal, cell, pipeline)",
-            enum=EXPORT_TABLES
+            enum=list(EXPORT_TABLE_NAMES)
         ),
         openapi.Parameter(
             'full',
@@ -1325,22 +1613,21 @@ def export_sqlite(request):
     if table:
         if table not in EXPORT_TABLES:
             return JsonResponse({
-                "error": f"Table '{table}' is not exportable. Choose from: {', '.join(EXPORT_TABLES)}."
+                "error": f"Table '{table}' is not exportable. Choose from: {', '.join(EXPORT_TABLE_NAMES)}."
             }, status=400)
 
         try:
-            csv_data = _dump_table_csv(db_file_path, table)
-            
             if include_ro_crate:
                 # Export with RO-Crate metadata
-                mem_file = io.BytesIO()
-                with zipfile.ZipFile(mem_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-                    zf.writestr(f'{table}.csv', csv_data)
+                # Spool to disk once the archive outgrows ZIP_SPOOL_MAX_SIZE
+                mem_file = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE)
+                with zipfile.ZipFile(mem_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zf:
+                    _write_table_csv_to_zip(zf, db_file_path, table, f'{table}.csv')
                     
                     # Generate RO-Crate metadata (no filters for full export)
                     file_list = [f'{table}.csv', 'ro-crate-metadata.json']
                     ro_crate = _generate_ro_crate_metadata(request.GET, counts, file_list, 'csv', db_file_path)
-                    zf.writestr('ro-crate-metadata.json', json.dumps(ro_crate, indent=2))
+                    _write_ro_crate_to_zip(zf, ro_crate)
                 
                 checksum = _compute_sha256_bytes(mem_file)
                 mem_file.seek(0)
@@ -1349,6 +1636,7 @@ def export_sqlite(request):
                 return response
             else:
                 # Plain CSV
+                csv_data = _dump_table_csv(db_file_path, table)
                 resp = HttpResponse(csv_data, content_type='text/csv')
                 resp['Content-Disposition'] = f'attachment; filename="{table}.csv"'
                 resp['X-SHA256-Checksum'] = _compute_sha256_bytes(csv_data)
@@ -1359,24 +1647,32 @@ def export_sqlite(request):
     # 2) Full ZIP export (raw DB + each table as CSV)
     if full:
         try:
-            mem_file = io.BytesIO()
-            with zipfile.ZipFile(mem_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-                # a) raw sqlite
-                with open(db_file_path, 'rb') as f:
-                    zf.writestr('exported_database.sqlite3', f.read())
-                
-                # b) per-table CSV exports
-                file_list = ['exported_database.sqlite3']
-                for tbl in EXPORT_TABLES:
-                    tbl_csv = _dump_table_csv(db_file_path, tbl)
-                    zf.writestr(f'{tbl}.csv', tbl_csv)
-                    file_list.append(f'{tbl}.csv')
-                
-                # c) RO-Crate metadata if requested
-                if include_ro_crate:
-                    file_list.append('ro-crate-metadata.json')
-                    ro_crate = _generate_ro_crate_metadata(request.GET, counts, file_list, 'zip', db_file_path)
-                    zf.writestr('ro-crate-metadata.json', json.dumps(ro_crate, indent=2))
+            # Spool to disk once the archive outgrows ZIP_SPOOL_MAX_SIZE (keeps RAM flat for large DBs)
+            mem_file = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE)
+            # Consistent snapshot so the DB file and the CSVs agree even if writers are active
+            snapshot_path = _snapshot_sqlite_db(db_file_path)
+            try:
+                with zipfile.ZipFile(mem_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zf:
+                    # a) raw sqlite (streamed, not slurped into memory)
+                    _write_file_to_zip(zf, snapshot_path, 'exported_database.sqlite3')
+                    
+                    # b) per-table CSV exports, all read through one connection
+                    file_list = ['exported_database.sqlite3']
+                    snapshot_conn = _open_export_reader(snapshot_path)
+                    try:
+                        for tbl in EXPORT_TABLE_NAMES:
+                            _write_table_csv_to_zip(zf, snapshot_conn, tbl, f'{tbl}.csv')
+                            file_list.append(f'{tbl}.csv')
+                    finally:
+                        snapshot_conn.close()
+                    
+                    # c) RO-Crate metadata if requested
+                    if include_ro_crate:
+                        file_list.append('ro-crate-metadata.json')
+                        ro_crate = _generate_ro_crate_metadata(request.GET, counts, file_list, 'zip', snapshot_path)
+                        _write_ro_crate_to_zip(zf, ro_crate)
+            finally:
+                os.unlink(snapshot_path)
             
             checksum = _compute_sha256_bytes(mem_file)
             mem_file.seek(0)
@@ -1387,19 +1683,22 @@ def export_sqlite(request):
         except Exception as e:
             return JsonResponse({"error": str(e)}, status=500)
 
-    # 3) Default: raw sqlite download
+    # 3) Default: raw sqlite download (from a consistent snapshot, never the live file)
     try:
+        snapshot_path = _snapshot_sqlite_db(db_file_path)
         if include_ro_crate:
             # Export SQLite with RO-Crate as ZIP
-            mem_file = io.BytesIO()
-            with zipfile.ZipFile(mem_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-                with open(db_file_path, 'rb') as f:
-                    zf.writestr('exported_database.sqlite3', f.read())
-                
-                # Generate RO-Crate metadata
-                file_list = ['exported_database.sqlite3', 'ro-crate-metadata.json']
-                ro_crate = _generate_ro_crate_metadata(request.GET, counts, file_list, 'sqlite', db_file_path)
-                zf.writestr('ro-crate-metadata.json', json.dumps(ro_crate, indent=2))
+            mem_file = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE)
+            try:
+                with zipfile.ZipFile(mem_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zf:
+                    _write_file_to_zip(zf, snapshot_path, 'exported_database.sqlite3')
+                    
+                    # Generate RO-Crate metadata
+                    file_list = ['exported_database.sqlite3', 'ro-crate-metadata.json']
+                    ro_crate = _generate_ro_crate_metadata(request.GET, counts, file_list, 'sqlite', snapshot_path)
+                    _write_ro_crate_to_zip(zf, ro_crate)
+            finally:
+                os.unlink(snapshot_path)
             
             checksum = _compute_sha256_bytes(mem_file)
             mem_file.seek(0)
@@ -1408,12 +1707,16 @@ def export_sqlite(request):
             return response
         else:
             # Plain SQLite
-            checksum = _compute_sha256_file(db_file_path)
+            checksum = _compute_sha256_file(snapshot_path)
+            snapshot, snapshot_size = _open_for_streaming(snapshot_path)
+            # The open handle keeps the data readable after the directory entry is gone
+            os.unlink(snapshot_path)
             response = FileResponse(
-                open(db_file_path, 'rb'),
+                snapshot,
                 as_attachment=True,
                 filename='exported_database.sqlite3'
             )
+            response['Content-Length'] = snapshot_size
             response['X-SHA256-Checksum'] = checksum
             return response
     except Exception as e:
@@ -1506,7 +1809,7 @@ def import_table(request, table):
     if table not in EXPORT_TABLES:
         return JsonResponse({
             "error": f"Table '{table}' not importable. "
-                     f"Choose from: {', '.join(EXPORT_TABLES)}"
+                     f"Choose from: {', '.join(EXPORT_TABLE_NAMES)}"
         }, status=400)
 
     uploaded = request.FILES['file']
@@ -1517,10 +1820,18 @@ def import_table(request, table):
         )
 
     # Read CSV file
+    handler = _SPECIAL_IMPORTERS.get(table)
     try:
         csv_content = uploaded.read().decode('utf-8', errors='ignore')
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
-        rows = list(csv_reader)
+        if handler:
+            # The interval/cell/signal importers look fields up by name
+            rows = list(csv.DictReader(io.StringIO(csv_content)))
+        else:
+            # The generic upsert only needs positional values: keep the reader's lists
+            # instead of building a dict per row (blank lines skipped, as DictReader does)
+            csv_reader = csv.reader(io.StringIO(csv_content))
+            columns = next(csv_reader, [])
+            rows = [row for row in csv_reader if row]
     except Exception as e:
         return JsonResponse(
             {"error": f"Failed to parse CSV file: {str(e)}"},
@@ -1528,12 +1839,8 @@ def import_table(request, table):
         )
 
     # Route to specialized handlers for interval, cell, signal (they handle empty rows)
-    if table == 'interval':
-        return _import_interval(request, rows)
-    elif table == 'cell':
-        return _import_cell(request, rows)
-    elif table == 'signal':
-        return _import_signal(request, rows)
+    if handler:
+        return handler(request, rows)
 
     # For other tables, check for empty rows
     if not rows:
@@ -1542,9 +1849,7 @@ def import_table(request, table):
             status=400
         )
 
-    # Default behavior for other tables
-    # Get column names from CSV header
-    columns = list(rows[0].keys())
+    # Default behavior for other tables: column names come from the CSV header
     if not columns:
         return JsonResponse(
             {"error": "CSV file has no columns."},
@@ -1556,21 +1861,40 @@ def import_table(request, table):
     column_names = ', '.join([f'"{col}"' for col in columns])
     insert_sql = f'INSERT OR REPLACE INTO "{table}" ({column_names}) VALUES ({placeholders})'
 
+    # Convert empty strings to None for proper NULL handling; short rows are padded
+    # with None and extra fields dropped so every row matches the header
+    n_columns = len(columns)
+    values_iter = (
+        [v if v != '' else None for v in (row if len(row) == n_columns else (row + [None] * n_columns)[:n_columns])]
+        for row in rows
+    )
+
     # Apply to database
     db_path = settings.DATABASES['default']['NAME']
     conn = sqlite3.connect(db_path)
     row_count = 0
     try:
         conn.execute('PRAGMA foreign_keys=OFF;')
+        # OPTIMIZATION: same speed-over-durability settings as _create_filtered_sqlite_db_fast.
+        # journal_mode sticks to the file in WAL mode, so only rollback-journal DBs are switched.
+        if conn.execute('PRAGMA journal_mode').fetchone()[0] != 'wal':
+            conn.execute('PRAGMA journal_mode=MEMORY')
+        conn.execute('PRAGMA synchronous=OFF')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-262144')
         conn.execute('BEGIN;')
         
-        for row in rows:
-            # Convert empty strings to None for proper NULL handling
-            # CRITICAL: Extract values in same order as columns (row.values() order is not guaranteed)
-            values = [row.get(col, None) if row.get(col, '') != '' else None for col in columns]
-            conn.execute(insert_sql, values)
-            row_count += 1
-            
+        # One prepared statement, fed in IMPORT_BATCH_SIZE chunks
+        cur = conn.cursor()
+        while batch := list(itertools.islice(values_iter, IMPORT_BATCH_SIZE)):
+            cur.executemany(insert_sql, batch)
+            row_count += len(batch)
+
+        # The upsert bypasses Assay.save(), so re-derive the assembly join table
+        if table in ('assay', 'assembly'):
+            _rebuild_assay_assembly_refs(conn)
+
+        bump_data_version(cur)
         conn.commit()
     except Exception as e:
         conn.rollback()
@@ -1583,32 +1907,53 @@ def import_table(request, table):
     })
 
 
+# Multi-value filters read by _build_filtered_queryset / _build_filtered_ids
+_EXPORT_FILTER_PARAMS = (
+    'study_name', 'study_external_id',
+    'assay_name', 'assay_external_id', 'assay_type', 'tissue',
+    'cell_type', 'assay_cell_type', 'treatment', 'platform',
+    'interval_type', 'biotype', 'assembly_name', 'assembly_species',
+    'cell_kind', 'cell_label',
+)
+
+
+# Export filter param -> Assay field, shared by _build_filtered_queryset / _build_filtered_ids
+_ASSAY_LOOKUPS = MappingProxyType({
+    'assay_name':        'name',
+    'assay_external_id': 'external_id',
+    'assay_type':        'type',
+    'tissue':            'tissue',
+    'cell_type':         'cell_type',  # legacy param
+    'assay_cell_type':   'cell_type',  # new explicit param
+    'treatment':         'treatment',
+    'platform':          'platform',
+})
+
+def _parse_export_filter_params(query_params):
+    """Parse every multi-value export filter once; returns {param: [values]}."""
+    return {p: _get_multi_value_param(query_params, p) for p in _EXPORT_FILTER_PARAMS}
+
+
 def _build_filtered_queryset(query_params):
     """
     Build a filtered Study queryset based on query parameters.
     This mirrors the logic in StudyListCreateView.get_queryset()
     """
-    from django.db.models import Count, Q
+    from django.db.models import Exists, OuterRef
     
+    params = _parse_export_filter_params(query_params)
     qs = Study.objects.all()
 
     # — Study‐level filters —
     # Handle multi-value study_name filter (supports arrays)
-    study_names = _get_multi_value_param(query_params, 'study_name')
+    study_names = params['study_name']
     if study_names:
-        # Build OR query for each study name
-        name_q = Q()
-        for name in study_names:
-            name_q |= Q(name__iexact=name)
-        qs = qs.filter(name_q)
+        qs = qs.filter(iexact_any('name', study_names))
     
     # Handle multi-value study_external_id filter
-    study_external_ids = _get_multi_value_param(query_params, 'study_external_id')
+    study_external_ids = params['study_external_id']
     if study_external_ids:
-        ext_id_q = Q()
-        for ext_id in study_external_ids:
-            ext_id_q |= Q(external_id__iexact=ext_id)
-        qs = qs.filter(ext_id_q)
+        qs = qs.filter(iexact_any('external_id', study_external_ids))
     
     if 'study_availability' in query_params or 'study_availability[]' in query_params:
         sval = _parse_bool_param(query_params.get('study_availability') or query_params.get('study_availability[]'))
@@ -1616,27 +1961,14 @@ def _build_filtered_queryset(query_params):
             qs = qs.filter(availability=sval)
 
     # — Assay‐level filters narrow which studies appear —
-    ASSAY_LOOKUPS = {
-        'assay_name':        'name__iexact',
-        'assay_external_id': 'external_id__iexact',
-        'assay_type':        'type__iexact',
-        'tissue':            'tissue__iexact',
-        'cell_type':         'cell_type__iexact',  # legacy param
-        'assay_cell_type':   'cell_type__iexact',  # new explicit param
-        'treatment':         'treatment__iexact',
-        'platform':          'platform__iexact',
-    }
     assay_q = Assay.objects.all()
     assay_filters_applied = False
-    for p, lookup in ASSAY_LOOKUPS.items():
+    for p, field in _ASSAY_LOOKUPS.items():
         # Handle multi-value parameters for assay fields
-        values = _get_multi_value_param(query_params, p)
+        values = params[p]
         if values:
             assay_filters_applied = True
-            field_q = Q()
-            for val in values:
-                field_q |= Q(**{lookup: val})
-            assay_q = assay_q.filter(field_q)
+            assay_q = assay_q.filter(iexact_any(field, values))
     
     raw_av = query_params.get('assay_availability') or query_params.get('assay_availability[]')
     av_bool = _parse_bool_param(raw_av)
@@ -1644,71 +1976,30 @@ def _build_filtered_queryset(query_params):
         assay_filters_applied = True
         assay_q = assay_q.filter(availability=av_bool)
     if assay_filters_applied:
-        qs = qs.filter(assays__in=assay_q).distinct()
+        qs = qs.filter(assays__in=assay_q.values('id')).distinct()
 
     # — Interval & Assembly filters on studies —
-    # OPTIMIZED: Query intervals/signals directly to get assay_ids, then filter studies
-    interval_types = _get_multi_value_param(query_params, 'interval_type')
-    if interval_types:
-        # Step 1: Get interval IDs matching the type filter
-        type_q = Q()
-        for itype in interval_types:
-            type_q |= Q(type__iexact=itype)
-        matching_interval_ids = list(Interval.objects.filter(type_q).values_list('id', flat=True))
-        
-        if matching_interval_ids:
-            # Step 2: Get distinct assay_ids from signals that reference these intervals
-            matching_assay_ids = Signal.objects.filter(
-                interval_id__in=matching_interval_ids
-            ).values_list('assay_id', flat=True).distinct()
-            qs = qs.filter(assays__id__in=matching_assay_ids)
-    
-    biotypes = _get_multi_value_param(query_params, 'biotype')
-    if biotypes:
-        # Step 1: Get interval IDs matching the biotype filter
-        biotype_q = Q()
-        for bio in biotypes:
-            biotype_q |= Q(biotype__iexact=bio)
-        matching_interval_ids = list(Interval.objects.filter(biotype_q).values_list('id', flat=True))
-        
-        if matching_interval_ids:
-            # Step 2: Get distinct assay_ids from signals that reference these intervals
-            matching_assay_ids = Signal.objects.filter(
-                interval_id__in=matching_interval_ids
-            ).values_list('assay_id', flat=True).distinct()
-            qs = qs.filter(assays__id__in=matching_assay_ids)
-    
-    assembly_names = _get_multi_value_param(query_params, 'assembly_name')
-    if assembly_names:
-        # Step 1: Get interval IDs for matching assemblies
-        asm_name_q = Q()
-        for asm_name in assembly_names:
-            asm_name_q |= Q(assembly__name__iexact=asm_name)
-        matching_interval_ids = list(Interval.objects.filter(asm_name_q).values_list('id', flat=True))
-        
-        if matching_interval_ids:
-            matching_assay_ids = Signal.objects.filter(
-                interval_id__in=matching_interval_ids
-            ).values_list('assay_id', flat=True).distinct()
-            qs = qs.filter(assays__id__in=matching_assay_ids)
-    
-    assembly_species = _get_multi_value_param(query_params, 'assembly_species')
-    if assembly_species:
-        # Step 1: Get interval IDs for matching assemblies
-        asm_spec_q = Q()
-        for spec in assembly_species:
-            asm_spec_q |= Q(assembly__species__iexact=spec)
-        matching_interval_ids = list(Interval.objects.filter(asm_spec_q).values_list('id', flat=True))
-        
-        if matching_interval_ids:
-            matching_assay_ids = Signal.objects.filter(
-                interval_id__in=matching_interval_ids
-            ).values_list('assay_id', flat=True).distinct()
-            qs = qs.filter(assays__id__in=matching_assay_ids)
+    # OPTIMIZED: EXISTS semi-join on signal → interval; stops at the first matching signal
+    # per study instead of materializing ID lists or a DISTINCT over the joined rows
+    INTERVAL_LOOKUPS = {
+        'interval_type':    'interval__type',
+        'biotype':          'interval__biotype',
+        'assembly_name':    'interval__assembly__name',
+        'assembly_species': 'interval__assembly__species',
+    }
+    signal_q = Signal.objects.filter(assay__study=OuterRef('pk'))
+    interval_filters_applied = False
+    for p, field in INTERVAL_LOOKUPS.items():
+        values = params[p]
+        if values:
+            interval_filters_applied = True
+            signal_q = signal_q.filter(iexact_any(field, values))
+    if interval_filters_applied:
+        qs = qs.filter(Exists(signal_q))
 
     # — Cell-level filters (direct via assay → cells) —
-    # OPTIMIZED: Query Cell table directly to get assay_ids, then filter studies
-    cell_types = _get_multi_value_param(query_params, 'cell_type') or _get_multi_value_param(query_params, 'cell_kind')
+    # OPTIMIZED: EXISTS semi-join on the Cell table instead of IN (SELECT DISTINCT assay_id ...)
+    cell_types = params['cell_type'] or params['cell_kind']
     if cell_types:
         normalized_types = []
         for kind in cell_types:
@@ -1719,243 +2010,174 @@ def _build_filtered_queryset(query_params):
                 k = 'spot'
             normalized_types.append(k)
         
-        cell_type_q = Q()
-        for k in normalized_types:
-            cell_type_q |= Q(type__iexact=k)
-        matching_assay_ids = Cell.objects.filter(cell_type_q).values_list('assay_id', flat=True).distinct()
-        qs = qs.filter(assays__id__in=matching_assay_ids)
+        qs = qs.filter(Exists(Cell.objects.filter(iexact_any('type', normalized_types), assay__study=OuterRef('pk'))))
 
-    cell_labels = _get_multi_value_param(query_params, 'cell_label')
+    cell_labels = params['cell_label']
     if cell_labels:
-        label_q = Q()
-        for lbl in cell_labels:
-            label_q |= Q(label__iexact=lbl)
-        matching_assay_ids = Cell.objects.filter(label_q).values_list('assay_id', flat=True).distinct()
-        qs = qs.filter(assays__id__in=matching_assay_ids)
+        qs = qs.filter(Exists(Cell.objects.filter(iexact_any('label', cell_labels), assay__study=OuterRef('pk'))))
 
     return qs.distinct().order_by('id')
 
 
-def _batch_queryset_ids(queryset, filter_field, id_list, batch_size=900):
-    """
-    Filter a queryset by a field with IN clause in batches to avoid SQLite's 999 variable limit.
-    Returns list of IDs (not a queryset).
-    """
-    if not id_list:
-        return []
-    
-    if len(id_list) <= batch_size:
-        return list(queryset.filter(**{f'{filter_field}__in': id_list}).values_list('id', flat=True))
-    
-    # Batch the query and collect IDs
-    all_ids = []
-    for i in range(0, len(id_list), batch_size):
-        batch = id_list[i:i + batch_size]
-        batch_ids = list(queryset.filter(**{f'{filter_field}__in': batch}).values_list('id', flat=True))
-        all_ids.extend(batch_ids)
-    
-    return all_ids
-
-
-def _build_filtered_ids(query_params, study_ids):
+def _build_filtered_ids(query_params, study_qs):
     """
     Derive filtered assay, signal, interval, and assembly ids for export.
     
-    OPTIMIZED: Always uses pre-fetched set-based IDs with batching for consistency and speed.
-    Sets avoid duplicates and provide O(1) lookup for filtering.
+    OPTIMIZED: each level is a lazy queryset filtered by a subquery on the level above
+    (study_qs is the queryset from _build_filtered_queryset), and all four ID lists come
+    back from a single CTE query - no ID round-trips, no 999-variable limit.
+
+    Returns (None, None, None, None) when no assay, cell or interval filter is set:
+    every row under the filtered studies is exported, so there is nothing to collect
+    and _create_filtered_sqlite_db derives each level from the one above.
     """
-    from django.db.models import Q
-    
-    assay_ids = _batch_queryset_ids(Assay.objects.all(), 'study_id', study_ids)
+    params = _parse_export_filter_params(query_params)
+    av_bool = _parse_bool_param(query_params.get('assay_availability'))
+    if av_bool is None and not any(
+        params[p] for p in (*_ASSAY_LOOKUPS, 'cell_kind', 'cell_label',
+                            'interval_type', 'biotype', 'assembly_name', 'assembly_species')
+    ):
+        return None, None, None, None
 
-    # Apply additional assay filters if present
-    if assay_ids:
-        assay_qs = Assay.objects.all()
-        
-        ASSAY_LOOKUPS = {
-            'assay_name':        'name__iexact',
-            'assay_external_id': 'external_id__iexact',
-            'assay_type':        'type__iexact',
-            'tissue':            'tissue__iexact',
-            'cell_type':         'cell_type__iexact',  # legacy param
-            'assay_cell_type':   'cell_type__iexact',  # new explicit param
-            'treatment':         'treatment__iexact',
-            'platform':          'platform__iexact',
-        }
+    assay_qs = Assay.objects.filter(study_id__in=study_qs.values('id'))
 
-        for p, lookup in ASSAY_LOOKUPS.items():
-            # Handle multi-value parameters
-            values = _get_multi_value_param(query_params, p)
-            if values:
-                field_q = Q()
-                for val in values:
-                    field_q |= Q(**{lookup: val})
-                assay_qs = assay_qs.filter(field_q)
+    # Apply additional assay filters if present
+    for p, field in _ASSAY_LOOKUPS.items():
+        # Handle multi-value parameters
+        values = params[p]
+        if values:
+            assay_qs = assay_qs.filter(iexact_any(field, values))
 
-        av_bool = _parse_bool_param(query_params.get('assay_availability'))
-        if av_bool is not None:
-            assay_qs = assay_qs.filter(availability=av_bool)
-        
-        # Filter by assay_ids in batches
-        filtered_assay_ids = set()
-        for batch in _batch_iter(assay_ids, 900):
-            filtered_assay_ids.update(assay_qs.filter(id__in=batch).values_list('id', flat=True))
-        
-        assay_ids = list(filtered_assay_ids)
+    if av_bool is not None:
+        assay_qs = assay_qs.filter(availability=av_bool)
 
-    # Fetch signals tied to the filtered assays - always fetch IDs for consistency
-    signal_ids = set()
-    for batch in _batch_iter(assay_ids, 900):
-        signal_ids.update(Signal.objects.filter(assay_id__in=batch).values_list('id', flat=True))
-    
+    # Signals tied to the filtered assays
+    signal_qs = Signal.objects.filter(assay_id__in=assay_qs.values('id'))
 
     # — Cell-level filters applied to signals —
-    cell_types = _get_multi_value_param(query_params, 'cell_type') or _get_multi_value_param(query_params, 'cell_kind')
-    cell_labels = _get_multi_value_param(query_params, 'cell_label')
-    if signal_ids and (cell_types or cell_labels):
-        filtered_signal_ids = set()
+    cell_types = params['cell_type'] or params['cell_kind']
+    cell_labels = params['cell_label']
+    if cell_types:
         # normalize types
         norm_types = []
-        for k in cell_types or []:
+        for k in cell_types:
             kk = (k or '').strip().lower()
             if kk in ('single cell', 'single-cell', 'singlecell'):
                 kk = 'cell'
             elif kk == 'srt':
                 kk = 'spot'
             norm_types.append(kk)
-        for batch in _batch_iter(list(signal_ids), 900):
-            qs_sig = Signal.objects.filter(id__in=batch)
-            if norm_types:
-                kind_q = Q()
-                for kk in norm_types:
-                    kind_q |= Q(cell__type__iexact=kk)
-                qs_sig = qs_sig.filter(kind_q)
-            if cell_labels:
-                label_q = Q()
-                for lbl in cell_labels:
-                    label_q |= Q(cell__label__iexact=lbl)
-                qs_sig = qs_sig.filter(label_q)
-            filtered_signal_ids.update(qs_sig.values_list('id', flat=True))
-        signal_ids = filtered_signal_ids
+        signal_qs = signal_qs.filter(iexact_any('cell__type', norm_types))
+    if cell_labels:
+        signal_qs = signal_qs.filter(iexact_any('cell__label', cell_labels))
 
     # Check for interval filters
     interval_filters_present = any(
-        _get_multi_value_param(query_params, k)
-        for k in ['interval_type', 'biotype', 'assembly_name', 'assembly_species']
+        params[k] for k in ('interval_type', 'biotype', 'assembly_name', 'assembly_species')
     )
 
     if interval_filters_present:
         interval_qs = Interval.objects.all()
         
         # Handle multi-value interval filters
-        interval_types = _get_multi_value_param(query_params, 'interval_type')
+        interval_types = params['interval_type']
         if interval_types:
-            type_q = Q()
-            for itype in interval_types:
-                type_q |= Q(type__iexact=itype)
-            interval_qs = interval_qs.filter(type_q)
+            interval_qs = interval_qs.filter(iexact_any('type', interval_types))
         
-        biotypes = _get_multi_value_param(query_params, 'biotype')
+        biotypes = params['biotype']
         if biotypes:
-            bio_q = Q()
-            for bio in biotypes:
-                bio_q |= Q(biotype__iexact=bio)
-            interval_qs = interval_qs.filter(bio_q)
+            interval_qs = interval_qs.filter(iexact_any('biotype', biotypes))
         
-        assembly_names = _get_multi_value_param(query_params, 'assembly_name')
+        assembly_names = params['assembly_name']
         if assembly_names:
-            asm_name_q = Q()
-            for asm_name in assembly_names:
-                asm_name_q |= Q(assembly__name__iexact=asm_name)
-            interval_qs = interval_qs.filter(asm_name_q)
+            interval_qs = interval_qs.filter(iexact_any('assembly__name', assembly_names))
         
-        assembly_species = _get_multi_value_param(query_params, 'assembly_species')
+        assembly_species = params['assembly_species']
         if assembly_species:
-            asm_spec_q = Q()
-            for spec in assembly_species:
-                asm_spec_q |= Q(assembly__species__iexact=spec)
-            interval_qs = interval_qs.filter(asm_spec_q)
+            interval_qs = interval_qs.filter(iexact_any('assembly__species', assembly_species))
 
-        # Get all matching interval IDs
-        interval_ids_filter = set(interval_qs.values_list('id', flat=True))
-        
         # Filter signals to only those with matching intervals
-        filtered_signal_ids = set()
-        for batch in _batch_iter(signal_ids, 900):
-            filtered_signal_ids.update(
-                Signal.objects.filter(id__in=batch, interval_id__in=interval_ids_filter)
-                    .values_list('id', flat=True)
-            )
-        signal_ids = filtered_signal_ids
-
-    # Get interval IDs from signals - OPTIMIZED: use Django ORM with batching
-    interval_ids = set()
-    if signal_ids:
-        signal_ids_list = list(signal_ids)
-        # Use Django ORM to avoid raw SQL formatting issues
-        for batch in _batch_iter(signal_ids_list, 900):
-            batch_ids = Signal.objects.filter(id__in=batch).values_list('interval_id', flat=True).distinct()
-            for interval_id in batch_ids:
-                # Filter out None and empty strings
-                if interval_id is not None and interval_id != '':
-                    interval_ids.add(interval_id)
-    
-
-    # Get assembly IDs from intervals - OPTIMIZED: use Django ORM with batching  
-    assembly_ids = set()
-    if interval_ids:
-        interval_ids_list = list(interval_ids)
-        # Use Django ORM to avoid raw SQL formatting issues
-        for batch in _batch_iter(interval_ids_list, 900):
-            batch_ids = Interval.objects.filter(id__in=batch).values_list('assembly_id', flat=True).distinct()
-            for assembly_id in batch_ids:
-                # Filter out None and empty strings
-                if assembly_id is not None and assembly_id != '':
-                    assembly_ids.add(assembly_id)
-    
-
-    return assay_ids, list(signal_ids), list(interval_ids), list(assembly_ids)
-
-
-def _batch_query(cursor, base_query, ids_list, batch_size=900):
-    """
-    Execute a query with IN clause in batches to avoid SQLite's 999 variable limit.
-    Returns all rows from all batches combined.
+        signal_qs = signal_qs.filter(interval_id__in=interval_qs.values('id'))
+
+    # Compose the querysets into one CTE statement: SQLite makes a single pass over the
+    # filtered signals (fsig is materialized once) and returns all four ID sets together
+    fa_sql, fa_params = assay_qs.order_by().values('id').query.sql_with_params()
+    fsig_sql, fsig_params = signal_qs.order_by().values('id', 'interval_id').query.sql_with_params()
+    sql = f"""
+        WITH fa AS ({fa_sql}),
+             fsig AS ({fsig_sql})
+        SELECT (SELECT json_group_array(id) FROM fa),
+               (SELECT json_group_array(id) FROM fsig),
+               (SELECT json_group_array(DISTINCT interval_id) FROM fsig
+                 WHERE interval_id IS NOT NULL),
+               (SELECT json_group_array(DISTINCT assembly_id) FROM interval
+                 WHERE id IN (SELECT interval_id FROM fsig) AND assembly_id IS NOT NULL)
     """
-    all_rows = []
-    for i in range(0, len(ids_list), batch_size):
-        batch = ids_list[i:i + batch_size]
-        placeholders = ','.join(['?'] * len(batch))
-        query = base_query.format(placeholders=placeholders)
-        rows = cursor.execute(query, batch).fetchall()
-        all_rows.extend(rows)
-    return all_rows
+    from django.db import connection
+    with connection.cursor() as cursor:
+        cursor.execute(sql, (*fa_params, *fsig_params))
+        row = cursor.fetchone()
+
+    # JSON arrays decode straight to ints (no per-id str objects as with group_concat + split)
+    return tuple(_json_loads(col) for col in row)
 
 
-def _build_sql_in_clause(ids_list, batch_size=900):
+# Tables copied by the filtered-export builders, in copy order
+_FILTERED_EXPORT_TABLES = ('study', 'assay', 'signal', 'interval', 'assembly', 'cell', 'pipeline')
+
+# Their DDL as read from the main DB's sqlite_master: {'tables': [sql], 'indexes': [(tbl_name, sql)]}.
+# Filled on the first export; cleared by post_migrate and import_sqlite, the two ways
+# the schema can change under a running server.
+_EXPORT_SCHEMA_CACHE = {}
+_EXPORT_SCHEMA_LOCK = threading.Lock()
+
+# One sqlite_master read returns both the table DDL and the index DDL; the table list
+# is fixed, so the statement text is built once
+_EXPORT_SCHEMA_SQL = f"""SELECT type, tbl_name, sql FROM source.sqlite_master
+    WHERE type IN ('table', 'index')
+    AND sql IS NOT NULL
+    AND tbl_name IN ({','.join('?' * len(_FILTERED_EXPORT_TABLES))})"""
+
+
+def _get_export_schema(conn):
     """
-    Build a SQL IN clause string for a list of IDs.
-    For large lists, SQLite has a limit of 999 variables, so we use literal values.
+    Return the cached export DDL, reading it through conn (with the main DB
+    attached as 'source') on first use.
     """
-    if not ids_list:
-        return "(-1)"  # Never matches
-    # Use literal values to avoid parameter limit
-    return "(" + ",".join(str(int(id)) for id in ids_list) + ")"
+    with _EXPORT_SCHEMA_LOCK:
+        if not _EXPORT_SCHEMA_CACHE:
+            schema_rows = conn.execute(_EXPORT_SCHEMA_SQL, _FILTERED_EXPORT_TABLES).fetchall()
+            _EXPORT_SCHEMA_CACHE['tables'] = [sql for obj_type, _, sql in schema_rows if obj_type == 'table']
+            _EXPORT_SCHEMA_CACHE['indexes'] = [
+                (tbl_name, sql) for obj_type, tbl_name, sql in schema_rows if obj_type == 'index'
+            ]
+        return _EXPORT_SCHEMA_CACHE['tables'], _EXPORT_SCHEMA_CACHE['indexes']
 
 
-def _escape_sql_string(s):
-    """Escape single quotes in SQL string values."""
-    if s is None:
-        return ''
-    return str(s).replace("'", "''")
+def clear_export_schema_cache(**kwargs):
+    """Drop the cached export DDL (also used as a post_migrate receiver)."""
+    with _EXPORT_SCHEMA_LOCK:
+        _EXPORT_SCHEMA_CACHE.clear()
 
 
-def _build_sql_in_values(values):
-    """Build SQL IN clause values from a list, properly escaped."""
-    if not values:
-        return None
-    escaped = [f"'{_escape_sql_string(v)}'" for v in values]
-    return ",".join(escaped)
+def _create_deferred_indexes(conn, index_rows, tables):
+    """
+    Build the secondary indexes in index_rows ((tbl_name, sql) pairs from sqlite_master)
+    for the given tables. Meant to run after a bulk copy: one sort pass per index instead
+    of a random b-tree insert per copied row.
+    """
+    for tbl_name, index_sql in index_rows:
+        if tbl_name not in tables:
+            continue
+        # Savepoint per index so a failing one is rolled back alone, never the copy
+        conn.execute('SAVEPOINT deferred_index')
+        try:
+            conn.execute(index_sql)
+        except sqlite3.OperationalError:
+            # Index might already exist (e.g., for PRIMARY KEY or UNIQUE constraints)
+            # or reference a column that was filtered out - skip it
+            conn.execute('ROLLBACK TO deferred_index')
+        conn.execute('RELEASE deferred_index')
 
 
 def _create_filtered_sqlite_db_fast(query_params):
@@ -1982,14 +2204,22 @@ def _create_filtered_sqlite_db_fast(query_params):
         conn = sqlite3.connect(temp_path, timeout=30.0, isolation_level='DEFERRED')
         
         # Set pragmas for speed
+        # page_size only takes effect before the first table is created in the fresh file;
+        # larger pages mean shallower b-trees for the bulk signal copy
+        conn.execute('PRAGMA page_size=32768')
         conn.execute('PRAGMA journal_mode=MEMORY')
         conn.execute('PRAGMA synchronous=OFF')
         conn.execute('PRAGMA cache_size=-128000')
         conn.execute('PRAGMA temp_store=MEMORY')
-        
+        conn.execute(f'PRAGMA mmap_size={SQLITE_MMAP_SIZE}')
+        conn.execute(f'PRAGMA threads={SQLITE_SORT_THREADS}')
+
         # Attach source database in read-only mode
         conn.execute(f'ATTACH DATABASE "file:{main_db_path}?mode=ro" AS source')
-        
+        # The source is only scanned: read its pages through mmap instead of pread + copy
+        conn.execute(f'PRAGMA source.mmap_size={SQLITE_MMAP_SIZE}')
+        conn.execute('PRAGMA source.cache_size=-262144')
+
         # CRITICAL OPTIMIZATION: Ensure indexes exist on source database for fast filtering
         # Check and create critical indexes if missing (improves query speed 10-100x)
         cursor = conn.cursor()
@@ -2012,20 +2242,28 @@ def _create_filtered_sqlite_db_fast(query_params):
         # BUILD ALL FILTER CONDITIONS IN PURE SQL
         # ============================================================
         
+        # Filter values are bound once into the filter_vals temp table (see below) and read
+        # back with IN (SELECT ...), so no user input is ever inlined into the SQL text
+        filter_vals = {}
+
+        def _in_filter(column, tag, values):
+            filter_vals[tag] = values
+            return f"{column} IN (SELECT v FROM filter_vals WHERE tag = '{tag}')"
+        
         # --- Study-level filters ---
         study_conditions = []
         
         study_names = _get_multi_value_param(query_params, 'study_name')
         if study_names:
-            study_conditions.append(f"s.name IN ({_build_sql_in_values(study_names)})")
+            study_conditions.append(_in_filter('s.name', 'study_name', study_names))
         
         study_external_ids = _get_multi_value_param(query_params, 'study_external_id')
         if study_external_ids:
-            study_conditions.append(f"s.external_id IN ({_build_sql_in_values(study_external_ids)})")
+            study_conditions.append(_in_filter('s.external_id', 'study_external_id', study_external_ids))
         
         study_notes = _get_multi_value_param(query_params, 'study_note')
         if study_notes:
-            study_conditions.append(f"s.note IN ({_build_sql_in_values(study_notes)})")
+            study_conditions.append(_in_filter('s.note', 'study_note', study_notes))
         
         raw_study_av = query_params.get('study_availability') or query_params.get('study_availability[]')
         study_av = _parse_bool_param(raw_study_av)
@@ -2039,36 +2277,36 @@ def _create_filtered_sqlite_db_fast(query_params):
         
         assay_names = _get_multi_value_param(query_params, 'assay_name')
         if assay_names:
-            assay_conditions.append(f"a.name IN ({_build_sql_in_values(assay_names)})")
+            assay_conditions.append(_in_filter('a.name', 'assay_name', assay_names))
         
         assay_external_ids = _get_multi_value_param(query_params, 'assay_external_id')
         if assay_external_ids:
-            assay_conditions.append(f"a.external_id IN ({_build_sql_in_values(assay_external_ids)})")
+            assay_conditions.append(_in_filter('a.external_id', 'assay_external_id', assay_external_ids))
         
         assay_types = _get_multi_value_param(query_params, 'assay_type')
         if assay_types:
-            assay_conditions.append(f"a.type IN ({_build_sql_in_values(assay_types)})")
+            assay_conditions.append(_in_filter('a.type', 'assay_type', assay_types))
         
         assay_targets = _get_multi_value_param(query_params, 'assay_target')
         if assay_targets:
-            assay_conditions.append(f"a.target IN ({_build_sql_in_values(assay_targets)})")
+            assay_conditions.append(_in_filter('a.target', 'assay_target', assay_targets))
         
         tissues = _get_multi_value_param(query_params, 'tissue')
         if tissues:
-            assay_conditions.append(f"a.tissue IN ({_build_sql_in_values(tissues)})")
+            assay_conditions.append(_in_filter('a.tissue', 'tissue', tissues))
         
         # Support both 'cell_type' (legacy) and 'assay_cell_type' for assay-level cell type
         assay_cell_types = _get_multi_value_param(query_params, 'assay_cell_type') or _get_multi_value_param(query_params, 'cell_type')
         if assay_cell_types:
-            assay_conditions.append(f"a.cell_type IN ({_build_sql_in_values(assay_cell_types)})")
+            assay_conditions.append(_in_filter('a.cell_type', 'assay_cell_type', assay_cell_types))
         
         treatments = _get_multi_value_param(query_params, 'treatment')
         if treatments:
-            assay_conditions.append(f"a.treatment IN ({_build_sql_in_values(treatments)})")
+            assay_conditions.append(_in_filter('a.treatment', 'treatment', treatments))
         
         platforms = _get_multi_value_param(query_params, 'platform')
         if platforms:
-            assay_conditions.append(f"a.platform IN ({_build_sql_in_values(platforms)})")
+            assay_conditions.append(_in_filter('a.platform', 'platform', platforms))
         
         raw_assay_av = query_params.get('assay_availability') or query_params.get('assay_availability[]')
         assay_av = _parse_bool_param(raw_assay_av)
@@ -2093,13 +2331,13 @@ def _create_filtered_sqlite_db_fast(query_params):
                     kk = 'spot'
                 norm_types.append(kk)
             signal_extra_conditions.append(
-                f"EXISTS (SELECT 1 FROM source.cell c WHERE c.id = sig.cell_id AND c.type IN ({_build_sql_in_values(norm_types)}))"
+                f"EXISTS (SELECT 1 FROM source.cell c WHERE c.id = sig.cell_id AND {_in_filter('c.type', 'cell_kind', norm_types)})"
             )
         
         cell_labels = _get_multi_value_param(query_params, 'cell_label')
         if cell_labels:
             signal_extra_conditions.append(
-                f"EXISTS (SELECT 1 FROM source.cell c WHERE c.id = sig.cell_id AND c.label IN ({_build_sql_in_values(cell_labels)}))"
+                f"EXISTS (SELECT 1 FROM source.cell c WHERE c.id = sig.cell_id AND {_in_filter('c.label', 'cell_label', cell_labels)})"
             )
         
         # Interval-level filters
@@ -2107,24 +2345,24 @@ def _create_filtered_sqlite_db_fast(query_params):
         
         interval_types = _get_multi_value_param(query_params, 'interval_type')
         if interval_types:
-            interval_conditions.append(f"i.type IN ({_build_sql_in_values(interval_types)})")
+            interval_conditions.append(_in_filter('i.type', 'interval_type', interval_types))
         
         biotypes = _get_multi_value_param(query_params, 'biotype')
         if biotypes:
-            interval_conditions.append(f"i.biotype IN ({_build_sql_in_values(biotypes)})")
+            interval_conditions.append(_in_filter('i.biotype', 'biotype', biotypes))
         
-        # Assembly filters (via interval)
+        # Assembly filters (via interval) - matched once into the filtered_assembly_ids
+        # temp table below, so intervals are joined against it instead of probing
+        # source.assembly per candidate interval
         assembly_names = _get_multi_value_param(query_params, 'assembly_name')
         assembly_species = _get_multi_value_param(query_params, 'assembly_species')
-        if assembly_names or assembly_species:
-            asm_conditions = []
-            if assembly_names:
-                asm_conditions.append(f"asm.name IN ({_build_sql_in_values(assembly_names)})")
-            if assembly_species:
-                asm_conditions.append(f"asm.species IN ({_build_sql_in_values(assembly_species)})")
-            interval_conditions.append(
-                f"EXISTS (SELECT 1 FROM source.assembly asm WHERE asm.id = i.assembly_id AND ({' OR '.join(asm_conditions)}))"
-            )
+        asm_conditions = []
+        if assembly_names:
+            asm_conditions.append(_in_filter('asm.name', 'assembly_name', assembly_names))
+        if assembly_species:
+            asm_conditions.append(_in_filter('asm.species', 'assembly_species', assembly_species))
+        if asm_conditions:
+            interval_conditions.append("i.assembly_id IN (SELECT id FROM filtered_assembly_ids)")
         
         if interval_conditions:
             signal_extra_conditions.append(
@@ -2139,9 +2377,18 @@ def _create_filtered_sqlite_db_fast(query_params):
         
         conn.execute('BEGIN TRANSACTION')
         
+        conn.execute('CREATE TEMP TABLE filter_vals (tag TEXT, v TEXT)')
+        conn.executemany(
+            'INSERT INTO filter_vals VALUES (?, ?)',
+            [(tag, v) for tag, values in filter_vals.items() for v in values],
+        )
+        
         # CRITICAL OPTIMIZATION: Create indexed temp tables for filtering
         # This massively speeds up the JOIN/IN operations on large signal tables
-        
+        # (id INTEGER PRIMARY KEY aliases the rowid, so these are already a single b-tree keyed
+        # by id - WITHOUT ROWID would store the same pages. Every SELECT below reads a primary
+        # key, so the ids are unique and need no DISTINCT.)
+
         # Create temp table for filtered studies with PRIMARY KEY for fast lookups
         conn.execute(f'''CREATE TEMP TABLE filtered_study_ids (id INTEGER PRIMARY KEY)''')
         conn.execute(f'''INSERT INTO filtered_study_ids 
@@ -2162,9 +2409,9 @@ def _create_filtered_sqlite_db_fast(query_params):
         if cell_types or cell_labels:
             cell_filter_parts = []
             if cell_types:
-                cell_filter_parts.append(f"c.type IN ({_build_sql_in_values(norm_types)})")
+                cell_filter_parts.append(_in_filter('c.type', 'cell_kind', norm_types))
             if cell_labels:
-                cell_filter_parts.append(f"c.label IN ({_build_sql_in_values(cell_labels)})")
+                cell_filter_parts.append(_in_filter('c.label', 'cell_label', cell_labels))
             
             cell_filter_sql = ' AND '.join(cell_filter_parts)
             conn.execute(f'''CREATE TEMP TABLE filtered_cell_ids (id INTEGER PRIMARY KEY)''')
@@ -2178,12 +2425,17 @@ def _create_filtered_sqlite_db_fast(query_params):
             signal_extra_conditions.append("sig.cell_id IN (SELECT id FROM filtered_cell_ids)")
             signal_extra_where = " AND " + " AND ".join(signal_extra_conditions) if signal_extra_conditions else ""
         
+        if asm_conditions:
+            conn.execute(f'''CREATE TEMP TABLE filtered_assembly_ids (id INTEGER PRIMARY KEY)''')
+            conn.execute(f'''INSERT INTO filtered_assembly_ids
+                SELECT asm.id FROM source.assembly asm WHERE {' OR '.join(asm_conditions)}''')
+            conn.execute('ANALYZE filtered_assembly_ids')
+        
         if interval_conditions:
             interval_filter_sql = ' AND '.join(interval_conditions)
             conn.execute(f'''CREATE TEMP TABLE filtered_interval_ids (id INTEGER PRIMARY KEY)''')
             conn.execute(f'''INSERT INTO filtered_interval_ids
                 SELECT i.id FROM source.interval i
-                LEFT JOIN source.assembly asm ON i.assembly_id = asm.id
                 WHERE {interval_filter_sql}''')
             conn.execute('ANALYZE filtered_interval_ids')
             
@@ -2196,74 +2448,75 @@ def _create_filtered_sqlite_db_fast(query_params):
         # CRITICAL: First create table schemas to preserve AUTOINCREMENT, PRIMARY KEY, and other constraints
         # Using CREATE TABLE AS SELECT does NOT preserve these constraints!
         # Get the CREATE TABLE statements from source database
-        tables_to_export = ['study', 'assay', 'signal', 'interval', 'assembly', 'cell', 'pipeline']
+        table_ddl, deferred_index_sql = _get_export_schema(conn)
         
-        cursor = conn.cursor()
-        for table_name in tables_to_export:
-            result = cursor.execute(
-                f"SELECT sql FROM source.sqlite_master WHERE type='table' AND name='{table_name}'"
-            ).fetchone()
-            
-            if result and result[0]:
-                create_sql = result[0]
-                # Execute the CREATE TABLE statement to preserve all constraints including AUTOINCREMENT
-                conn.execute(create_sql)
+        # Execute the CREATE TABLE statements to preserve all constraints including AUTOINCREMENT
+        for create_sql in table_ddl:
+            conn.execute(create_sql)
+        
+        # Secondary indexes (deferred_index_sql) are only built after the bulk INSERTs below:
+        # one sort pass per index instead of a random b-tree insert per copied row.
+        # PRIMARY KEY / UNIQUE autoindexes (sql IS NULL) come with the table DDL above.
         
         # Now insert filtered data into the tables
         # 1. Copy studies (use temp table for consistency)
         conn.execute('''INSERT INTO study 
             SELECT s.* FROM source.study s 
-            INNER JOIN filtered_study_ids ON s.id = filtered_study_ids.id''')
+            INNER JOIN filtered_study_ids ON s.id = filtered_study_ids.id
+            ORDER BY s.id''')
         
         # 2. Copy assays (use temp table - much faster than subquery)
         conn.execute('''INSERT INTO assay 
             SELECT a.* FROM source.assay a
-            INNER JOIN filtered_assay_ids ON a.id = filtered_assay_ids.id''')
+            INNER JOIN filtered_assay_ids ON a.id = filtered_assay_ids.id
+            ORDER BY a.id''')
         
         # 3. Copy signals (the big one) - use INNER JOIN instead of IN for 10-100x speedup
         # INNER JOIN with indexed temp table is MUCH faster than IN (subquery)
+        # ORDER BY id: the join yields rows grouped by assay, so sort once and let every
+        # insert below append to the rightmost b-tree leaf instead of splitting random pages
+        # (the other copies scan by rowid, so their ORDER BY id costs no sort at all)
         conn.execute(f'''INSERT INTO signal 
             SELECT sig.* FROM source.signal sig 
             INNER JOIN filtered_assay_ids ON sig.assay_id = filtered_assay_ids.id
-            WHERE 1=1{signal_extra_where}''')
+            WHERE 1=1{signal_extra_where}
+            ORDER BY sig.id''')
+        
+        # signal is fully loaded, so its indexes can be built now: the interval and cell
+        # copies below then read interval_id / cell_id from covering index scans instead
+        # of scanning the whole signal table (and sorting it) once each
+        _create_deferred_indexes(conn, deferred_index_sql, {'signal'})
         
         # 4. Copy intervals - only those referenced by our signals
+        # IN (SELECT fk ...) is planned as one LIST SUBQUERY (built once, already de-duplicated,
+        # so no DISTINCT) and then a rowid SEARCH into source per referenced id. That is the
+        # right way round here: cost scales with the exported subset, whereas a correlated
+        # EXISTS would SCAN the whole source table and probe the destination per row.
         conn.execute('''INSERT INTO interval 
             SELECT * FROM source.interval 
-            WHERE id IN (SELECT DISTINCT interval_id FROM signal WHERE interval_id IS NOT NULL)''')
+            WHERE id IN (SELECT interval_id FROM signal WHERE interval_id IS NOT NULL)
+            ORDER BY id''')
         
         # 5. Copy assemblies - only those referenced by our intervals
         conn.execute('''INSERT INTO assembly 
             SELECT * FROM source.assembly 
-            WHERE id IN (SELECT DISTINCT assembly_id FROM interval WHERE assembly_id IS NOT NULL)''')
+            WHERE id IN (SELECT assembly_id FROM interval WHERE assembly_id IS NOT NULL)
+            ORDER BY id''')
         
         # 6. Copy cells - only those referenced by our signals
         conn.execute('''INSERT INTO cell 
             SELECT * FROM source.cell 
-            WHERE id IN (SELECT DISTINCT cell_id FROM signal WHERE cell_id IS NOT NULL)''')
+            WHERE id IN (SELECT cell_id FROM signal WHERE cell_id IS NOT NULL)
+            ORDER BY id''')
         
         # 7. Copy pipelines - only those referenced by our assays
         conn.execute('''INSERT INTO pipeline 
             SELECT * FROM source.pipeline 
-            WHERE id IN (SELECT DISTINCT pipeline_id FROM assay WHERE pipeline_id IS NOT NULL)''')
-        
-        # Copy indexes for the exported tables to improve query performance
-        # Note: SQLite automatically creates indexes for PRIMARY KEY and UNIQUE constraints,
-        # but we need to manually create other indexes (like foreign key indexes)
-        index_results = cursor.execute(
-            f"""SELECT sql FROM source.sqlite_master 
-               WHERE type='index' 
-               AND sql IS NOT NULL 
-               AND tbl_name IN ({','.join([f"'{t}'" for t in tables_to_export])})"""
-        ).fetchall()
-        
-        for (index_sql,) in index_results:
-            try:
-                conn.execute(index_sql)
-            except sqlite3.OperationalError:
-                # Index might already exist (e.g., for PRIMARY KEY or UNIQUE constraints)
-                # or reference a column that was filtered out - skip it
-                pass
+            WHERE id IN (SELECT pipeline_id FROM assay WHERE pipeline_id IS NOT NULL)
+            ORDER BY id''')
+        
+        # Build the deferred secondary indexes (foreign key / lookup indexes) on the loaded tables
+        _create_deferred_indexes(conn, deferred_index_sql, set(_FILTERED_EXPORT_TABLES) - {'signal'})
         
         conn.execute('COMMIT')
         
@@ -2294,181 +2547,106 @@ def _create_filtered_sqlite_db_fast(query_params):
 
 def _create_filtered_sqlite_db(study_ids, assay_ids=None, signal_ids=None, interval_ids=None, assembly_ids=None):
     """
-    Create an in-memory SQLite database containing only the filtered entities.
-    Returns (bytes, counts_dict)
+    Create a SQLite database containing only the filtered entities.
+    Returns (temp_path, counts_dict)
     
-    OPTIMIZED: Uses executemany for bulk inserts with batching for large datasets.
+    OPTIMIZED: the main database is ATTACHed and every table is copied with a single
+    INSERT ... SELECT inside one transaction, so no row is ever pulled into Python.
+    The given ID lists are bound once into indexed temp tables (no 999-variable limit);
+    None means "no filter at this level" and the rows are derived from the level above.
     """
-    mem_db = io.BytesIO()
-    conn = sqlite3.connect(':memory:')
-    signal_rows = []
-    interval_rows = []
-    signal_ids_local = []
+    conn = sqlite3.connect(':memory:', isolation_level=None)
     
     try:
-        # Create schema by copying from main database
         main_db_path = settings.DATABASES['default']['NAME']
-        main_conn = sqlite3.connect(main_db_path)
         
         # OPTIMIZATION: Set SQLite pragmas for faster operations
         conn.execute('PRAGMA journal_mode=MEMORY')
         conn.execute('PRAGMA synchronous=OFF')
         conn.execute('PRAGMA cache_size=-128000')  # 128MB cache (increased from 64MB)
         conn.execute('PRAGMA temp_store=MEMORY')
-        conn.execute('PRAGMA locking_mode=EXCLUSIVE')  # Faster for single connection
+        conn.execute(f'PRAGMA threads={SQLITE_SORT_THREADS}')
+        # main only: a bare locking_mode also applies to ATTACHed DBs, and a read-only
+        # WAL source cannot be opened in exclusive mode
+        conn.execute('PRAGMA main.locking_mode=EXCLUSIVE')  # Faster for single connection
         
-        # Get all table creation statements
-        cursor = main_conn.cursor()
-        cursor.execute(
-            "SELECT name, sql FROM sqlite_master WHERE type='table' AND name IN "
-            "('study', 'assay', 'signal', 'interval', 'assembly', 'cell', 'pipeline')"
-        )
-        
-        for table_name, create_sql in cursor.fetchall():
+        conn.execute(f'ATTACH DATABASE "file:{main_db_path}?mode=ro" AS source')
+        # The source is only scanned: read its pages through mmap instead of pread + copy
+        conn.execute(f'PRAGMA source.mmap_size={SQLITE_MMAP_SIZE}')
+        conn.execute('PRAGMA source.cache_size=-128000')
+        
+        # Create schema by copying from main database. Only the tables are created now;
+        # their secondary indexes are built after the copies below (PRIMARY KEY / UNIQUE
+        # autoindexes have sql IS NULL and come with the table DDL)
+        table_ddl, deferred_index_sql = _get_export_schema(conn)
+        for create_sql in table_ddl:
             conn.execute(create_sql)
         
-        # OPTIMIZATION: Begin transaction for all inserts
-        conn.execute('BEGIN TRANSACTION')
+        # The explicit ID lists are bound once into temp tables up front, so the seven
+        # copies below are plain parameter-less statements
+        def _id_table(name, ids):
+            conn.execute(f'CREATE TEMP TABLE {name} (id INTEGER PRIMARY KEY)')
+            conn.executemany(f'INSERT OR IGNORE INTO {name} VALUES (?)', ((int(i),) for i in ids))
+            return f'(SELECT id FROM {name})'
         
-        # Now copy filtered data using batched queries
-        main_cursor = main_conn.cursor()
+        # 1) studies
+        study_where = f"id IN {_id_table('export_study_ids', study_ids or [])}"
         
-        # 1) Copy studies - OPTIMIZED with executemany
-        study_rows = []
-        if study_ids:
-            study_rows = _batch_query(
-                main_cursor,
-                "SELECT * FROM study WHERE id IN ({placeholders})",
-                study_ids
-            )
+        # 2) assays - explicit ids, or every assay of the exported studies
+        if assay_ids is not None:
+            assay_where = f"id IN {_id_table('export_assay_ids', assay_ids)}"
+        else:
+            assay_where = 'study_id IN (SELECT id FROM study)'
         
-        if study_rows:
-            cols = [description[0] for description in main_cursor.description]
-            insert_sql = f"INSERT INTO study ({','.join(cols)}) VALUES ({','.join(['?'] * len(cols))})"
-            conn.executemany(insert_sql, study_rows)
+        # 3) signals - explicit ids, or every signal of the exported assays
+        if signal_ids is not None:
+            signal_where = (
+                f"id IN {_id_table('export_signal_ids', signal_ids)}"
+                " AND EXISTS (SELECT 1 FROM assay)"
+            )
+        else:
+            signal_where = 'assay_id IN (SELECT id FROM assay)'
         
-        # 2) Get assays - OPTIMIZED with executemany
-        assay_rows = []
-        assay_ids_all = []
-        if assay_ids is not None:
-            if assay_ids:
-                assay_rows = _batch_query(
-                    main_cursor,
-                    "SELECT * FROM assay WHERE id IN ({placeholders})",
-                    assay_ids
-                )
-                assay_ids_all = list(assay_ids)
-            else:
-                assay_rows = []
-                assay_ids_all = []
+        # 4) intervals - explicit ids, or those referenced by the exported signals
+        if interval_ids is not None:
+            interval_where = (
+                f"id IN {_id_table('export_interval_ids', interval_ids)}"
+                " AND EXISTS (SELECT 1 FROM assay)"
+            )
         else:
-            assay_rows = _batch_query(
-                main_cursor,
-                "SELECT * FROM assay WHERE study_id IN ({placeholders})",
-                study_ids
+            interval_where = 'id IN (SELECT interval_id FROM signal)'
+        
+        # 5) assemblies - explicit ids, or those referenced by the exported intervals
+        if assembly_ids is not None:
+            assembly_where = (
+                f"id IN {_id_table('export_assembly_ids', assembly_ids)}"
+                " AND EXISTS (SELECT 1 FROM interval)"
             )
-            assay_ids_all = [row[0] for row in assay_rows] if assay_rows else []
-
-        if assay_rows:
-            cols = [description[0] for description in main_cursor.description]
-            insert_sql = f"INSERT INTO assay ({','.join(cols)}) VALUES ({','.join(['?'] * len(cols))})"
-            conn.executemany(insert_sql, assay_rows)
-
-        # 3) Get signals - signals_ids is always provided (never None)
-        signal_ids_local = []
-        if assay_ids_all:
-            # signal_ids is always a list now (from set-based approach)
-            signal_rows = _batch_query(
-                main_cursor,
-                "SELECT * FROM signal WHERE id IN ({placeholders})",
-                signal_ids
-            ) if signal_ids else []
-            signal_ids_local = list(signal_ids) if signal_ids else []
-
-            if signal_rows:
-                cols = [description[0] for description in main_cursor.description]
-                insert_sql = f"INSERT INTO signal ({','.join(cols)}) VALUES ({','.join(['?'] * len(cols))})"
-                conn.executemany(insert_sql, signal_rows)
-            
-            # 4) Get intervals from signals - OPTIMIZED
-            # interval_ids is always provided from _build_filtered_ids
-            target_interval_ids = interval_ids if interval_ids else []
-
-            if target_interval_ids:
-                interval_rows = _batch_query(
-                    main_cursor,
-                    "SELECT * FROM interval WHERE id IN ({placeholders})",
-                    target_interval_ids
-                )
-                
-                if interval_rows:
-                    interval_cols = [description[0] for description in main_cursor.description]
-                    insert_sql = f"INSERT INTO interval ({','.join(interval_cols)}) VALUES ({','.join(['?'] * len(interval_cols))})"
-                    conn.executemany(insert_sql, interval_rows)
-                
-                # 5) Get assemblies from intervals - assembly_ids is always provided
-                assembly_ids_local = assembly_ids if assembly_ids else []
-                
-                if assembly_ids_local:
-                    assembly_rows = _batch_query(
-                        main_cursor,
-                        "SELECT * FROM assembly WHERE id IN ({placeholders})",
-                        assembly_ids_local
-                    )
-                    
-                    if assembly_rows:
-                        cols = [description[0] for description in main_cursor.description]
-                        insert_sql = f"INSERT INTO assembly ({','.join(cols)}) VALUES ({','.join(['?'] * len(cols))})"
-                        conn.executemany(insert_sql, assembly_rows)
-        
-        # 6) Get cells for filtered assays - OPTIMIZED
-        cell_rows = []
-        if assay_ids_all:
-            try:
-                cell_rows = _batch_query(
-                    main_cursor,
-                    "SELECT * FROM cell WHERE assay_id IN ({placeholders})",
-                    assay_ids_all
-                )
-                
-                if cell_rows:
-                    cols = [description[0] for description in main_cursor.description]
-                    insert_sql = f"INSERT INTO cell ({','.join(cols)}) VALUES ({','.join(['?'] * len(cols))})"
-                    conn.executemany(insert_sql, cell_rows)
-            except Exception as e:
-                # Cell table might not exist or have data
-                pass
-                pass
+        else:
+            assembly_where = 'id IN (SELECT assembly_id FROM interval)'
+        
+        # 6) cells of the exported assays, 7) pipelines referenced by them
+        cell_where = 'assay_id IN (SELECT id FROM assay)'
+        pipeline_where = 'id IN (SELECT pipeline_id FROM assay)'
+        
+        # OPTIMIZATION: all seven copies go to SQLite as one script inside one transaction
+        # (left open so the indexes below are built before COMMIT)
+        copy_order = (
+            ('study', study_where), ('assay', assay_where), ('signal', signal_where),
+            ('interval', interval_where), ('assembly', assembly_where),
+            ('cell', cell_where), ('pipeline', pipeline_where),
+        )
+        conn.executescript('BEGIN IMMEDIATE;\n' + '\n'.join(
+            f'INSERT INTO {table} SELECT * FROM source.{table} WHERE {where};'
+            for table, where in copy_order
+        ))
         
-        # 7) Get pipelines referenced by filtered assays - OPTIMIZED
-        pipeline_ids = []
-        if assay_ids_all:
-            try:
-                # Get unique pipeline_ids from assays
-                pipeline_id_rows = _batch_query(
-                    main_cursor,
-                    "SELECT DISTINCT pipeline_id FROM assay WHERE id IN ({placeholders})",
-                    assay_ids_all
-                )
-                pipeline_ids = list(set([row[0] for row in pipeline_id_rows]))
-                
-                if pipeline_ids:
-                    pipeline_rows = _batch_query(
-                        main_cursor,
-                        "SELECT * FROM pipeline WHERE id IN ({placeholders})",
-                        pipeline_ids
-                    )
-                    
-                    if pipeline_rows:
-                        cols = [description[0] for description in main_cursor.description]
-                        insert_sql = f"INSERT INTO pipeline ({','.join(cols)}) VALUES ({','.join(['?'] * len(cols))})"
-                        conn.executemany(insert_sql, pipeline_rows)
-            except Exception as e:
-                # Pipeline table might not exist or have data
-                pass
+        # Build the secondary indexes on the loaded tables
+        _create_deferred_indexes(conn, deferred_index_sql, set(_FILTERED_EXPORT_TABLES))
         
         # OPTIMIZATION: Commit the transaction
         conn.execute('COMMIT')
+        conn.execute('DETACH DATABASE source')
         
         # Get counts from the in-memory database
         counts = {
@@ -2478,34 +2656,33 @@ def _create_filtered_sqlite_db(study_ids, assay_ids=None, signal_ids=None, inter
             'intervals': conn.execute('SELECT COUNT(*) FROM interval').fetchone()[0],
         }
         
-        # Write to bytes - get raw DB file content
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-            temp_path = tmp.name
-        
+        # Write the in-memory DB to a temp file and hand back its path, like
+        # _create_filtered_sqlite_db_fast: callers stream it instead of holding the bytes
+        temp_fd, temp_path = tempfile.mkstemp(suffix='.sqlite3')
+        os.close(temp_fd)
         try:
-            # Backup from memory to temp file, then read as bytes
-            temp_conn = sqlite3.connect(temp_path)
-            conn.backup(temp_conn)
-            temp_conn.close()
-            
-            with open(temp_path, 'rb') as f:
-                db_bytes = f.read()
-        finally:
-            import os as os_module
-            try:
-                os_module.unlink(temp_path)
-            except:
-                pass
+            if sqlite3.sqlite_version_info >= (3, 27, 0):
+                # One statement inside SQLite, and the output comes out compacted
+                # (VACUUM INTO accepts the empty file mkstemp left behind)
+                conn.execute('VACUUM INTO ?', (temp_path,))
+            else:
+                temp_conn = sqlite3.connect(temp_path)
+                try:
+                    conn.backup(temp_conn)
+                finally:
+                    temp_conn.close()
+        except Exception:
+            os.unlink(temp_path)
+            raise
         
-        return db_bytes, counts
+        # Caller deletes temp_path once the response has been streamed
+        return temp_path, counts
         
     except Exception as e:
         raise e
     finally:
         try:
             conn.close()
-            main_conn.close()
         except:
             pass
 
@@ -2557,22 +2734,21 @@ def export_filtered_sqlite(request):
                 if temp_db_path and os_module.path.exists(temp_db_path):
                     os_module.unlink(temp_db_path)
                 return JsonResponse({
-                    "error": f"Table '{table}' not found. Choose from: {', '.join(EXPORT_TABLES)}"
+                    "error": f"Table '{table}' not found. Choose from: {', '.join(EXPORT_TABLE_NAMES)}"
                 }, status=400)
             try:
-                # Use temp file path instead of loading into RAM
-                csv_data = _dump_table_csv(temp_db_path, table)
-                
                 if include_ro_crate:
                     # Export single CSV with RO-Crate metadata as ZIP
-                    mem_file = io.BytesIO()
-                    with zipfile.ZipFile(mem_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-                        zf.writestr(f'{table}.csv', csv_data)
+                    # Spool to disk once the archive outgrows ZIP_SPOOL_MAX_SIZE
+                    mem_file = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE)
+                    with zipfile.ZipFile(mem_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zf:
+                        # Stream from the temp file path instead of loading into RAM
+                        _write_table_csv_to_zip(zf, temp_db_path, table, f'{table}.csv')
                         
                         # Generate RO-Crate metadata (pass temp_db_path instead of db_bytes)
                         file_list = [f'{table}.csv', 'ro-crate-metadata.json']
                         ro_crate = _generate_ro_crate_metadata(query_params, counts, file_list, 'csv', temp_db_path)
-                        zf.writestr('ro-crate-metadata.json', json.dumps(ro_crate, indent=2))
+                        _write_ro_crate_to_zip(zf, ro_crate)
                     
                     checksum = _compute_sha256_bytes(mem_file)
                     mem_file.seek(0)
@@ -2589,6 +2765,7 @@ def export_filtered_sqlite(request):
                     return response
                 else:
                     # Plain CSV export
+                    csv_data = _dump_table_csv(temp_db_path, table)
                     resp = HttpResponse(csv_data, content_type='text/csv')
                     resp['Content-Disposition'] = f'attachment; filename="filtered_{table}.csv"'
                     resp['X-SHA256-Checksum'] = _compute_sha256_bytes(csv_data)
@@ -2604,26 +2781,30 @@ def export_filtered_sqlite(request):
         # ZIP export (database + CSVs)
         if export_format == 'zip':
             try:
-                mem_file = io.BytesIO()
-                with zipfile.ZipFile(mem_file, 'w', zipfile.ZIP_DEFLATED) as zf:
+                # Spool to disk once the archive outgrows ZIP_SPOOL_MAX_SIZE
+                mem_file = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE)
+                with zipfile.ZipFile(mem_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zf:
                     # Add database file from disk (avoids loading into RAM)
-                    zf.write(temp_db_path, 'filtered_database.sqlite3')
+                    _write_file_to_zip(zf, temp_db_path, 'filtered_database.sqlite3')
                     
                     file_list = ['filtered_database.sqlite3']
-                    # Always include all CSVs when ZIP format is requested
-                    for table_name in EXPORT_TABLES:
-                        try:
-                            csv_data = _dump_table_csv(temp_db_path, table_name)
-                            zf.writestr(f'{table_name}.csv', csv_data)
-                            file_list.append(f'{table_name}.csv')
-                        except:
-                            pass
+                    # Always include all CSVs when ZIP format is requested (one connection for all)
+                    export_conn = _open_export_reader(temp_db_path)
+                    try:
+                        for table_name in EXPORT_TABLE_NAMES:
+                            try:
+                                _write_table_csv_to_zip(zf, export_conn, table_name, f'{table_name}.csv')
+                                file_list.append(f'{table_name}.csv')
+                            except:
+                                pass
+                    finally:
+                        export_conn.close()
                     
                     # Add RO-Crate metadata if requested
                     if include_ro_crate:
                         file_list.append('ro-crate-metadata.json')
                         ro_crate = _generate_ro_crate_metadata(query_params, counts, file_list, 'zip', temp_db_path)
-                        zf.writestr('ro-crate-metadata.json', json.dumps(ro_crate, indent=2))
+                        _write_ro_crate_to_zip(zf, ro_crate)
                 
                 checksum = _compute_sha256_bytes(mem_file)
                 mem_file.seek(0)
@@ -2648,15 +2829,16 @@ def export_filtered_sqlite(request):
         try:
             if include_ro_crate:
                 # Export SQLite with RO-Crate metadata as ZIP
-                mem_file = io.BytesIO()
-                with zipfile.ZipFile(mem_file, 'w', zipfile.ZIP_DEFLATED) as zf:
+                # Spool to disk once the archive outgrows ZIP_SPOOL_MAX_SIZE
+                mem_file = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE)
+                with zipfile.ZipFile(mem_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zf:
                     # Add database file from disk (avoids loading into RAM)
-                    zf.write(temp_db_path, 'filtered_database.sqlite3')
+                    _write_file_to_zip(zf, temp_db_path, 'filtered_database.sqlite3')
                     
                     # Generate RO-Crate metadata
                     file_list = ['filtered_database.sqlite3', 'ro-crate-metadata.json']
                     ro_crate = _generate_ro_crate_metadata(query_params, counts, file_list, 'sqlite', temp_db_path)
-                    zf.writestr('ro-crate-metadata.json', json.dumps(ro_crate, indent=2))
+                    _write_ro_crate_to_zip(zf, ro_crate)
                 
                 checksum = _compute_sha256_bytes(mem_file)
                 mem_file.seek(0)
@@ -2674,31 +2856,20 @@ def export_filtered_sqlite(request):
             else:
                 # OPTIMIZED: Stream file directly - uses ~8KB RAM instead of GBs!
                 checksum = _compute_sha256_file(temp_db_path)
+                db_file, db_size = _open_for_streaming(temp_db_path)
+                # The open handle keeps the data readable after the directory entry is gone,
+                # so no cleanup hook is needed and the response wraps a plain file that the
+                # WSGI server's file_wrapper can hand to sendfile()
+                os_module.unlink(temp_db_path)
                 response = FileResponse(
-                    open(temp_db_path, 'rb'),
+                    db_file,
                     as_attachment=True,
                     filename="filtered_database.sqlite3",
                     content_type='application/x-sqlite3'
                 )
                 response['X-SHA256-Checksum'] = checksum
-                # FileResponse will handle file cleanup automatically when request completes
-                # But we need to schedule cleanup ourselves
-                response._temp_file_path = temp_db_path
-
-                # Get file size for Content-Length header
-                response['Content-Length'] = os_module.path.getsize(temp_db_path)
-                
-                # Register cleanup callback
-                def cleanup_temp_file(sender, **kwargs):
-                    if hasattr(sender, '_temp_file_path') and os_module.path.exists(sender._temp_file_path):
-                        try:
-                            os_module.unlink(sender._temp_file_path)
-                        except:
-                            pass
-                
-                # Clean up after response is sent
-                from django.core.signals import request_finished
-                request_finished.connect(cleanup_temp_file, sender=response, weak=False)
+                # Content-Length from the same fd that is streamed
+                response['Content-Length'] = db_size
                 
                 return response
         except Exception as e:
@@ -2723,55 +2894,6 @@ def export_filtered_sqlite(request):
                 pass
 
 
-
-def _dump_table_csv_from_bytes(db_bytes, table_name):
-    """
-    Export table from in-memory database bytes as CSV.
-    """
-    import tempfile
-    import os
-
-    temp_path = None
-    conn = None
-    try:
-        with tempfile.NamedTemporaryFile(suffix='.sqlite3', delete=False) as tmp:
-            temp_path = tmp.name
-            tmp.write(db_bytes)
-            tmp.flush()
-
-        conn = sqlite3.connect(temp_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute(f'SELECT * FROM "{table_name}"')
-        rows = cursor.fetchall()
-
-        if not rows:
-            cursor.execute(f'PRAGMA table_info("{table_name}")')
-            columns = [col[1] for col in cursor.fetchall()]
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(columns)
-            return output.getvalue()
-
-        columns = rows[0].keys()
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(columns)
-
-        for row in rows:
-            writer.writerow([row[col] for col in columns])
-
-        return output.getvalue()
-    finally:
-        if conn:
-            conn.close()
-        if temp_path:
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
-
 def _bulk_import_intervals_cells_signals(request, interval_rows, cell_rows, signal_rows, omit_zero_signals=False, progress=None):
     """
     Bulk import intervals, cells, and signals in a single atomic transaction.
@@ -2785,7 +2907,7 @@ def _bulk_import_intervals_cells_signals(request, interval_rows, cell_rows, sign
     - counts: dict with imported row counts
     - error: str (if failed)
     """
-    from django.db import transaction
+    from django.db import connection, transaction
     
     # Validate parameters
     assembly_id = request.data.get('assembly_id')
@@ -2856,10 +2978,11 @@ def _bulk_import_intervals_cells_signals(request, interval_rows, cell_rows, sign
                     return float(s)
                 return float(s)
 
-            # Batching constants keep memory bounded for huge uploads
-            INTERVAL_BATCH = 2000
-            CELL_BATCH = 2000
-            SIGNAL_BATCH = 5000
+            # Batching constants keep memory bounded for huge uploads; bulk_create
+            # splits a batch further to fit SQLite's bound-variable limit on its own
+            INTERVAL_BATCH = 10000
+            CELL_BATCH = 10000
+            SIGNAL_BATCH = 50000
 
             # --- STEP 1: Import Intervals (stream + chunk) ---
             interval_id_map = {}
@@ -2936,16 +3059,21 @@ def _bulk_import_intervals_cells_signals(request, interval_rows, cell_rows, sign
 
             _flush_interval_batch()
 
-            # Resolve parental relationships with a lightweight bulk_update
+            # Resolve parental relationships with one prepared UPDATE by primary key
+            # (bulk_update would build a CASE WHEN over the whole batch per statement)
             if parental_links:
                 updates = []
                 for child_csv, parent_csv in parental_links:
                     parent_db_id = interval_id_map.get(parent_csv)
                     child_db_id = interval_id_map.get(child_csv)
                     if parent_db_id and child_db_id:
-                        updates.append(Interval(id=child_db_id, parental_id=str(parent_db_id)))
+                        updates.append((str(parent_db_id), child_db_id))
                 if updates:
-                    Interval.objects.bulk_update(updates, ['parental_id'], batch_size=INTERVAL_BATCH)
+                    with connection.cursor() as cursor:
+                        cursor.executemany(
+                            'UPDATE interval SET parental_id = %s WHERE id = %s',
+                            updates
+                        )
                 progress(phase='intervals', step=2, step_name='Parsing Intervals', total_steps=5, processed=interval_count)
 
             # --- STEP 2: Import Cells (stream + chunk) ---
@@ -2966,27 +3094,27 @@ def _bulk_import_intervals_cells_signals(request, interval_rows, cell_rows, sign
                 cell_names = []
                 progress(phase='cells', step=3, step_name='Parsing Cells', total_steps=5, processed=cell_count, message=f'Parsing cells... {cell_count}/{total_cells}')
 
-            for row in cell_rows:
-                name = row.get('name', '').strip()
-                if not name:
-                    continue
-                x_coord_val = row.get('x_coordinate', '').strip()
-                y_coord_val = row.get('y_coordinate', '').strip()
-                z_coord_val = row.get('z_coordinate', '').strip()
-
-                def _to_int(val):
-                    if not val:
-                        return None
-                    try:
-                        return int(val)
-                    except Exception:
-                        return None
-
+            # Strip and parse the cell columns once, column-wise in pandas, instead of
+            # four .get().strip() calls and an int() attempt per field on every row
+            cells_df = pd.DataFrame.from_records(
+                cell_rows, columns=['name', 'x_coordinate', 'y_coordinate', 'z_coordinate']
+            ).fillna('')
+            cells_df['name'] = cells_df['name'].astype(str).str.strip()
+            cells_df = cells_df[cells_df['name'] != '']
+            for col in ('x_coordinate', 'y_coordinate', 'z_coordinate'):
+                values = cells_df[col].astype(str).str.strip()
+                # Plain integers only, as int() accepted; anything else becomes None
+                values = values.where(values.str.fullmatch(r'[+-]?[0-9]+'))
+                cells_df[col] = pd.to_numeric(values).astype('Int64').astype(object).where(values.notna(), None)
+
+            for name, x_coord, y_coord, z_coord in zip(
+                cells_df['name'], cells_df['x_coordinate'], cells_df['y_coordinate'], cells_df['z_coordinate']
+            ):
                 cell_batch.append(Cell(
                     name=name,
-                    x_coordinate=_to_int(x_coord_val),
-                    y_coordinate=_to_int(y_coord_val),
-                    z_coordinate=_to_int(z_coord_val),
+                    x_coordinate=x_coord,
+                    y_coordinate=y_coord,
+                    z_coordinate=z_coord,
                     assay_id=assay_id
                 ))
                 cell_names.append(name)
@@ -3000,31 +3128,93 @@ def _bulk_import_intervals_cells_signals(request, interval_rows, cell_rows, sign
             signal_count = 0
             zero_signal_count = 0
             non_zero_signal_count = 0
-            interval_seen = set()
-            interval_has_nonzero = set()
-            signal_batch = []
+            # Byte maps over this import's interval db ids, indexed by position in their
+            # sorted array (not by id, which would size them by the table's largest id):
+            # which intervals have a signal, and which a non-zero one. Each batch marks
+            # them with one vectorized store; the final counts are a count_nonzero
+            # instead of merging per-batch unique sets
+            interval_db_ids = np.unique(np.fromiter(interval_id_map.values(), dtype=np.int64, count=len(interval_id_map)))
+            interval_seen = np.zeros(len(interval_db_ids), dtype=np.uint8)
+            interval_nonzero = np.zeros(len(interval_db_ids), dtype=np.uint8)
+            # Columnar batch (one list per column) instead of a Signal instance per row;
+            # flushed through one prepared INSERT like _import_signal. The CSV interval and
+            # cell keys are kept raw and resolved a whole batch at a time at flush, so the
+            # id maps are probed in one tight map(dict.get) pass rather than between the
+            # per-row parsing work
+            signal_vals, p_vals, padj_vals, signal_interval_keys, signal_cell_keys = [], [], [], [], []
+
+            def _resolve_keys(keys, id_map):
+                ids = list(map(id_map.get, keys))
+                for i in itertools.filterfalse(ids.__getitem__, range(len(ids))):
+                    if keys[i].isdigit():
+                        ids[i] = id_map.get(str(int(keys[i])))
+                return ids
 
             def _flush_signal_batch():
-                nonlocal signal_batch, signal_count
-                if not signal_batch:
+                nonlocal signal_count
+                if not signal_vals:
                     return
-                Signal.objects.bulk_create(signal_batch, batch_size=SIGNAL_BATCH)
-                signal_count += len(signal_batch)
-                signal_batch = []
+                batch_vals, batch_p_vals, batch_padj_vals = signal_vals, p_vals, padj_vals
+                signal_interval_ids = _resolve_keys(signal_interval_keys, interval_id_map)
+                signal_cell_ids = _resolve_keys(signal_cell_keys, cell_name_map)
+                if '' in cell_name_map:
+                    # A blank cell_id means "no cell", never a lookup
+                    signal_cell_ids = [db_id if key else None for key, db_id in zip(signal_cell_keys, signal_cell_ids)]
+                if not all(signal_interval_ids):
+                    # Rows whose interval is not in the map are skipped
+                    keep = list(map(bool, signal_interval_ids))
+                    batch_vals = list(itertools.compress(batch_vals, keep))
+                    batch_p_vals = list(itertools.compress(batch_p_vals, keep))
+                    batch_padj_vals = list(itertools.compress(batch_padj_vals, keep))
+                    signal_interval_ids = list(itertools.compress(signal_interval_ids, keep))
+                    signal_cell_ids = list(itertools.compress(signal_cell_ids, keep))
+                # Every resolved id is a value of interval_id_map, so searchsorted finds it
+                batch_positions = np.searchsorted(interval_db_ids, np.asarray(signal_interval_ids, dtype=np.int64))
+                interval_seen[batch_positions] = 1
+                interval_nonzero[batch_positions[np.asarray(batch_vals) > 0]] = 1
+                with connection.cursor() as cursor:
+                    cursor.executemany(
+                        'INSERT INTO signal (signal, p_value, padj_value, assay_id, interval_id, cell_id) '
+                        'VALUES (%s, %s, %s, %s, %s, %s)',
+                        zip(batch_vals, batch_p_vals, batch_padj_vals, itertools.repeat(assay_id), signal_interval_ids, signal_cell_ids)
+                    )
+                signal_count += len(batch_vals)
+                # Cleared in place so the bound .append methods used by the row loop stay valid
+                for column in (signal_vals, p_vals, padj_vals, signal_interval_keys, signal_cell_keys):
+                    column.clear()
                 progress(phase='signals', step=4, step_name='Parsing Signals', total_steps=5, processed=signal_count, message=f'Parsing signals... {signal_count}/{total_signals}', zeros=zero_signal_count, non_zero=non_zero_signal_count)
 
-            for row in signal_rows:
-                signal_val = row.get('signal', '').strip()
-                p_value_val = row.get('p_value', '').strip()
-                padj_value_val = row.get('padj_value', '').strip()
-                csv_interval_id = row.get('interval_id', '').strip()
-                csv_cell_id = row.get('cell_id', '').strip()
+            # Bind the per-row callables to locals once: the loop below runs once per
+            # signal row, and each global or attribute lookup there adds up
+            normalize_number = _normalize_number
+            append_signal = signal_vals.append
+            append_p = p_vals.append
+            append_padj = padj_vals.append
+            append_interval_key = signal_interval_keys.append
+            append_cell_key = signal_cell_keys.append
+            flush_signal_batch = _flush_signal_batch
+            signal_batch_size = SIGNAL_BATCH
+            # The signal schema is fixed and every row comes from the same CSV header, so
+            # when the header has all five columns they are pulled out of each row by one
+            # C-level itemgetter mapped over the rows instead of five .get() calls per row
+            signal_fields = ('signal', 'p_value', 'padj_value', 'interval_id', 'cell_id')
+            if signal_rows and all(name in signal_rows[0] for name in signal_fields):
+                signal_field_rows = map(operator.itemgetter(*signal_fields), signal_rows)
+            else:
+                signal_field_rows = ([row.get(name, '') for name in signal_fields] for row in signal_rows)
+
+            for signal_val, p_value_val, padj_value_val, csv_interval_id, csv_cell_id in signal_field_rows:
+                signal_val = signal_val.strip()
+                p_value_val = p_value_val.strip()
+                padj_value_val = padj_value_val.strip()
+                csv_interval_id = csv_interval_id.strip()
+                csv_cell_id = csv_cell_id.strip()
 
                 if not signal_val or not csv_interval_id:
                     continue
 
                 try:
-                    signal = _normalize_number(signal_val)
+                    signal = normalize_number(signal_val)
                 except ValueError:
                     continue
 
@@ -3036,51 +3226,34 @@ def _bulk_import_intervals_cells_signals(request, interval_rows, cell_rows, sign
                     non_zero_signal_count += 1
 
                 try:
-                    p_value = _normalize_number(p_value_val) if p_value_val else None
+                    p_value = normalize_number(p_value_val) if p_value_val else None
                 except ValueError:
                     p_value = None
 
                 try:
-                    padj_value = _normalize_number(padj_value_val) if padj_value_val else None
+                    padj_value = normalize_number(padj_value_val) if padj_value_val else None
                 except ValueError:
                     padj_value = None
 
-                interval_db_id = interval_id_map.get(csv_interval_id)
-                if not interval_db_id and csv_interval_id.isdigit():
-                    interval_db_id = interval_id_map.get(str(int(csv_interval_id)))
-                if not interval_db_id:
-                    continue
-
-                cell_db_id = None
-                if csv_cell_id:
-                    cell_db_id = cell_name_map.get(csv_cell_id)
-                    if not cell_db_id and csv_cell_id.isdigit():
-                        cell_db_id = cell_name_map.get(str(int(csv_cell_id)))
-
-                interval_seen.add(interval_db_id)
-                if signal > 0:
-                    interval_has_nonzero.add(interval_db_id)
-
-                signal_batch.append(Signal(
-                    signal=signal,
-                    p_value=p_value,
-                    padj_value=padj_value,
-                    assay_id=assay_id,
-                    interval_id=interval_db_id,
-                    cell_id=cell_db_id
-                ))
+                append_signal(signal)
+                append_p(p_value)
+                append_padj(padj_value)
+                append_interval_key(csv_interval_id)
+                append_cell_key(csv_cell_id)
 
-                if len(signal_batch) >= SIGNAL_BATCH:
-                    _flush_signal_batch()
+                if len(signal_vals) >= signal_batch_size:
+                    flush_signal_batch()
 
             _flush_signal_batch()
 
-            non_zero_interval_count = len(interval_has_nonzero)
-            total_interval_with_signals = len(interval_seen)
+            non_zero_interval_count = int(np.count_nonzero(interval_nonzero))
+            total_interval_with_signals = int(np.count_nonzero(interval_seen))
             zero_only_interval_count = total_interval_with_signals - non_zero_interval_count
             Assay.objects.filter(id=assay_id).update(
                 interval_count=total_interval_with_signals
             )
+            # bulk_create and the raw INSERTs send no post_save
+            bump_data_version()
 
             return {
                 'success': True,
@@ -3214,28 +3387,11 @@ def import_bulk_data(request):
 
     # For huge files (79M+ rows), we can't load everything into memory.
     # Instead: copy uploaded files to temp location, then stream from there in background.
-    import tempfile
-    import shutil
-    
     try:
         # Save uploaded files to temporary location
-        interval_temp = tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False)
-        shutil.copyfileobj(interval_file.file, interval_temp)
-        interval_temp.close()
-        interval_path = interval_temp.name
-        
-        if cell_file:
-            cell_temp = tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False)
-            shutil.copyfileobj(cell_file.file, cell_temp)
-            cell_temp.close()
-            cell_path = cell_temp.name
-        else:
-            cell_path = None
-            
-        signal_temp = tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False)
-        shutil.copyfileobj(signal_file.file, signal_temp)
-        signal_temp.close()
-        signal_path = signal_temp.name
+        interval_path = _save_upload_to_temp(interval_file)
+        cell_path = _save_upload_to_temp(cell_file) if cell_file else None
+        signal_path = _save_upload_to_temp(signal_file)
         
     except Exception as e:
         return JsonResponse({"error": f"Failed to save uploaded files: {str(e)}"}, status=400)
@@ -3257,23 +3413,48 @@ def import_bulk_data(request):
 
     def _run_job():
         try:
-            def _progress(**fields):
-                _update_progress(job_id, **fields, status='running')
-
-            # Use pandas-based import for 10-100x speed improvement
-            result = bulk_import_with_pandas(
+            _truthy = ('1', 'true', 'yes', 'on')
+            import_kwargs = dict(
                 interval_path=interval_path,
                 cell_path=cell_path,
                 signal_path=signal_path,
                 assembly_id=int(request.data.get('assembly_id')),
                 assay_id=int(request.data.get('assay_id')),
                 omit_zero_signals=omit_zero_signals,
-                deduplicate_intervals=str(request.data.get('deduplicate_intervals', '')).lower() in ('1','true','yes','on'),
-                ignore_optional_type_errors=str(request.data.get('ignore_optional_type_errors', '')).lower() in ('1','true','yes','on'),
-                ignore_conflicts=str(request.data.get('ignore_conflicts', '')).lower() in ('1','true','yes','on'),
-                ignore_row_errors=str(request.data.get('ignore_row_errors', '')).lower() in ('1','true','yes','on'),
-                progress=_progress
+                deduplicate_intervals=str(request.data.get('deduplicate_intervals', '')).lower() in _truthy,
+                ignore_optional_type_errors=str(request.data.get('ignore_optional_type_errors', '')).lower() in _truthy,
+                ignore_conflicts=str(request.data.get('ignore_conflicts', '')).lower() in _truthy,
+                ignore_row_errors=str(request.data.get('ignore_row_errors', '')).lower() in _truthy,
+            )
+            db_name = str(settings.DATABASES['default']['NAME'])
+
+            # The pandas import runs in a spawned child process so its CPU work does not
+            # compete with request handling for this process's GIL; this thread only
+            # relays the child's progress messages into PROGRESS_STORE
+            mp_context = multiprocessing.get_context('spawn')
+            progress_queue = mp_context.Queue()
+            worker = mp_context.Process(
+                target=run_bulk_import, args=(progress_queue, db_name, import_kwargs), daemon=True
             )
+            worker.start()
+            result = None
+            while True:
+                try:
+                    kind, payload = progress_queue.get(timeout=1)
+                except queue.Empty:
+                    if not worker.is_alive():
+                        break
+                    continue
+                if kind == 'progress':
+                    _update_progress(job_id, **payload, status='running')
+                    continue
+                if kind == 'error':
+                    raise RuntimeError(payload)
+                result = payload
+                break
+            worker.join()
+            if result is None:
+                raise RuntimeError(f'Import worker exited with code {worker.exitcode}')
 
             if result.get('success'):
                 _update_progress(job_id, status='completed', phase='done', step=5, step_name='Complete', total_steps=5, message=result.get('message'), result=result)
@@ -1,6 +1,6 @@
 # pipelines/tests.py
 
-from django.urls import reverse
+from django.urls import reverse, reverse_lazy
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -8,16 +8,21 @@ from studies.models import Study
 from assay.models   import Assay
 from .models        import Pipeline
 
+# Resolved once per process rather than in every setUp
+PIPELINE_LIST_URL = reverse_lazy('pipeline-list')
+
 class PipelineAPITestCase(APITestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # 1) Create a Study & Assay so the FK chain is satisfied
-        self.study = Study.objects.create(
+        #    (once per class; each test runs in a transaction rolled back to this state)
+        cls.study = Study.objects.create(
             external_id="STUDY123",
             name="Study 1",
             description="Dummy study for pipelines tests",
             availability=True
         )
-        self.assay = Assay.objects.create(
+        cls.assay = Assay.objects.create(
             external_id="GSM111222",
             type="ChIP-Seq",
             target="GATA3",
@@ -29,30 +34,30 @@ class PipelineAPITestCase(APITestCase):
             platform="Illumina NextSeq 2000",
             kit="TruSeq ChIP Library Preparation Kit",
             description="Dummy assay for pipelines tests",
-            study=self.study,
+            study=cls.study,
             availability=True
         )
 
         # URL for list/create
-        self.base_url = reverse('pipeline-list')
+        cls.base_url = PIPELINE_LIST_URL
 
         # payload for the DRF client (assay as PK)
-        self.api_payload = {
+        cls.api_payload = {
             'name':         'scRNA-Seq analysis',
             'description': (
                 'the pipeline for analyzing scRNA-Seq from assay XX includes '
                 'fastqc, fastp, star and htseq'
             ),
             'external_url': 'https://workflowhub.eu/xxxxxxxxxx',
-            'assay':        self.assay.pk,
+            'assay':        cls.assay.pk,
         }
 
         # payload for direct ORM creation (assay as instance)
-        self.orm_payload = {
-            'name':         self.api_payload['name'],
-            'description':  self.api_payload['description'],
-            'external_url': self.api_payload['external_url'],
-            'assay':        self.assay,
+        cls.orm_payload = {
+            'name':         cls.api_payload['name'],
+            'description':  cls.api_payload['description'],
+            'external_url': cls.api_payload['external_url'],
+            'assay':        cls.assay,
         }
 
     def test_create_pipeline(self):
@@ -1,7 +1,13 @@
 # pipelines/views.py
 from rest_framework import generics
+from rest_framework.response import Response
 from .models import Pipeline
 from .serializers import PipelineSerializer
+from bmintyApi.conditional import conditional_detail
+
+# Rows fetched per round trip when an unpaginated list is streamed with .iterator()
+LIST_CHUNK_SIZE = 2000
+
 
 class PipelineListCreateAPIView(generics.ListCreateAPIView):
     """
@@ -10,9 +16,20 @@ class PipelineListCreateAPIView(generics.ListCreateAPIView):
     - GET: List all pipelines
     - POST: Create a new pipeline
     """
-    queryset = Pipeline.objects.all()
+    # Load only the columns the serializer renders
+    queryset = Pipeline.objects.only(*PipelineSerializer.Meta.fields)
     serializer_class = PipelineSerializer
 
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        # Unpaginated: stream the rows instead of caching every Pipeline instance first
+        serializer = self.get_serializer(queryset.iterator(chunk_size=LIST_CHUNK_SIZE), many=True)
+        return Response(serializer.data)
+
 class PipelineDetailAPIView(generics.RetrieveAPIView):
     """
     Pipeline detail endpoint (read-only).
@@ -21,6 +38,10 @@ class PipelineDetailAPIView(generics.RetrieveAPIView):
     
     Note: Pipelines cannot be modified or deleted once created.
     """
-    queryset = Pipeline.objects.all()
+    queryset = Pipeline.objects.only(*PipelineSerializer.Meta.fields)
     serializer_class = PipelineSerializer
     lookup_field = 'pipeline_id'
+
+    @conditional_detail(queryset, 'pipeline_id')
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
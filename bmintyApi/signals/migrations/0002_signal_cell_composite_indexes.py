@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-16 06:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assay', '0001_initial'),
+        ('interval', '0001_initial'),
+        ('signals', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cell',
+            index=models.Index(fields=['assay', 'type'], name='idx_cell_assay_type'),
+        ),
+        migrations.AddIndex(
+            model_name='signal',
+            index=models.Index(fields=['assay', 'cell'], name='idx_signal_assay_cell'),
+        ),
+        migrations.AddIndex(
+            model_name='signal',
+            index=models.Index(fields=['assay', 'interval'], name='idx_signal_assay_interval'),
+        ),
+    ]
@@ -3,6 +3,46 @@ from assay.models import Assay
 from interval.models import Interval
 from django.core.exceptions import ValidationError
 
+
+_NA_STRINGS = frozenset(("NA", "N/A", "NULL"))
+
+
+def _normalize_float(val, required=False):
+    # Normalize numeric fields to handle European formats. Only required fields raise
+    # ValidationError; optional ones get None for missing/NA values instead
+    # Exact float/int first: the common case skips the isinstance tuple and all string work
+    val_type = type(val)
+    if val_type is float:
+        return val
+    if val_type is int:
+        return float(val)
+    if val is None:
+        if required:
+            raise ValidationError("signal cannot be null")
+        return None
+    if isinstance(val, (int, float)):
+        return float(val)
+    s = str(val).strip()
+    if not s:
+        if required:
+            raise ValidationError("signal cannot be empty")
+        return None
+    if s.upper() in _NA_STRINGS:
+        if required:
+            raise ValidationError("signal cannot be NA")
+        return None
+    if " " in s:
+        s = s.replace(" ", "")
+    if "," in s:
+        s = s.replace(".", "")
+        s = s.replace(",", ".")
+        return float(s)
+    if s.count('.') > 1:
+        s = s.replace('.', '')
+        return float(s)
+    return float(s)
+
+
 class Cell(models.Model):
     # SQLite has “id INTEGER PRIMARY KEY AUTOINCREMENT”
     # so we just let Django use its default `id = AutoField(primary_key=True)`
@@ -31,6 +71,9 @@ class Cell(models.Model):
     class Meta:
         db_table = 'cell'        
         ordering = ['id']
+        indexes = [
+            models.Index(fields=['assay', 'type'], name='idx_cell_assay_type'),
+        ]
 
     def __str__(self):
         return f"{self.name} (#{self.id})"
@@ -73,54 +116,23 @@ class Signal(models.Model):
     class Meta:
         db_table = 'signal'        
         ordering = ['id']
+        # Per-assay/study aggregates (distinct cells, intervals with signals) are
+        # answered from these alone, without touching the signal rows
+        indexes = [
+            models.Index(fields=['assay', 'cell'], name='idx_signal_assay_cell'),
+            models.Index(fields=['assay', 'interval'], name='idx_signal_assay_interval'),
+        ]
 
     def __str__(self):
         return f"Signal {self.id}: {self.signal}"
 
     def clean(self):
-        # Normalize numeric fields to handle European formats
-        def _normalize_float(val, required=False):
-            if val is None:
-                if required:
-                    raise ValidationError("signal cannot be null")
-                return None
-            if isinstance(val, (int, float)):
-                return float(val)
-            s = str(val).strip()
-            if not s:
-                if required:
-                    raise ValidationError("signal cannot be empty")
-                return None
-            if s.upper() in ("NA", "N/A", "NULL"):
-                if required:
-                    raise ValidationError("signal cannot be NA")
-                return None
-            s = s.replace(" ", "")
-            if "," in s:
-                s = s.replace(".", "")
-                s = s.replace(",", ".")
-                return float(s)
-            if s.count('.') > 1:
-                s = s.replace('.', '')
-                return float(s)
-            return float(s)
-
         # Apply normalization
         self.signal = _normalize_float(self.signal, required=True)
-        try:
-            self.p_value = _normalize_float(self.p_value, required=False)
-        except ValidationError:
-            self.p_value = None
-        try:
-            self.padj_value = _normalize_float(self.padj_value, required=False)
-        except ValidationError:
-            self.padj_value = None
+        self.p_value = _normalize_float(self.p_value)
+        self.padj_value = _normalize_float(self.padj_value)
 
     def save(self, *args, **kwargs):
         # Ensure normalization occurs on any save/create path
-        try:
-            self.clean()
-        except ValidationError as e:
-            # Re-raise to prevent invalid save
-            raise e
+        self.clean()
         super().save(*args, **kwargs)
@@ -1,18 +1,35 @@
+from functools import cached_property
+
 from rest_framework import serializers
 from .models import Cell, Signal
 
 
+class CachedReadableFieldsMixin:
+    """
+    DRF already caches `fields` per serializer, but `_readable_fields` is a generator
+    re-filtering them for every object rendered; with many=True the one child
+    serializer renders every row, so keep the readable fields as a tuple instead.
+    """
+    @cached_property
+    def _readable_fields(self):
+        return tuple(field for field in self.fields.values() if not field.write_only)
+
+
 class SafeIntegerField(serializers.IntegerField):
     def to_representation(self, value):
-        if value in (None, '', 'NULL'):
+        # Plain ints (the usual stored value) need no coercion or error handling
+        if type(value) is int:
+            return value
+        if value is None or value == '' or value == 'NULL':
             return None
+        # IntegerField.to_representation is int(value); call it directly
         try:
-            return super().to_representation(value)
+            return int(value)
         except (TypeError, ValueError):
             return None
 
 
-class CellSerializer(serializers.ModelSerializer):
+class CellSerializer(CachedReadableFieldsMixin, serializers.ModelSerializer):
     x_coordinate = SafeIntegerField(allow_null=True, required=False)
     y_coordinate = SafeIntegerField(allow_null=True, required=False)
     z_coordinate = SafeIntegerField(allow_null=True, required=False)
@@ -29,7 +46,7 @@ class CellSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id']
 
-class SignalSerializer(serializers.ModelSerializer):
+class SignalSerializer(CachedReadableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Signal
         fields = [
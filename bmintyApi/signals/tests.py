@@ -1,4 +1,4 @@
-from django.urls import reverse
+from django.urls import reverse, reverse_lazy
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -7,12 +7,17 @@ from assay.models     import Assay
 from interval.models import Interval
 from .models          import Cell, Signal
 
+# Resolved once per process rather than in every setUp
+CELL_LIST_URL   = reverse_lazy('cell-list')
+SIGNAL_LIST_URL = reverse_lazy('signal-list')
+
 class CellAPITestCase(APITestCase):
-    def setUp(self):
-        self.base_url = reverse('cell-list')
+    @classmethod
+    def setUpTestData(cls):
+        cls.base_url = CELL_LIST_URL
 
         # API payload: no assay field
-        self.api_payload = {
+        cls.api_payload = {
             'name':         'CGTAGCTTCG',
             'x_coordinate': 100,
             'y_coordinate': 200,
@@ -20,7 +25,7 @@ class CellAPITestCase(APITestCase):
         }
 
         # ORM payload is identical
-        self.orm_payload = dict(self.api_payload)
+        cls.orm_payload = dict(cls.api_payload)
 
     def test_create_cell(self):
         resp = self.client.post(self.base_url, self.api_payload, format='json')
@@ -58,15 +63,17 @@ class CellAPITestCase(APITestCase):
 
 
 class SignalAPITestCase(APITestCase):
-    def setUp(self):
-        # Create the chain: Study → Assay → Interval
-        self.study = Study.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        # Create the chain: Study → Assay → Interval (once per class; each test runs
+        # in a transaction rolled back to this state)
+        cls.study = Study.objects.create(
             external_id="STUDY123",
             name="Test Study",
             description="For signals",
             availability=True
         )
-        self.assay = Assay.objects.create(
+        cls.assay = Assay.objects.create(
             external_id="GSM1",
             type="ChIP-Seq",
             target="GATA3",
@@ -78,10 +85,10 @@ class SignalAPITestCase(APITestCase):
             platform="NextSeq",
             kit="TruSeq",
             description="D",
-            study=self.study,
+            study=cls.study,
             availability=True
         )
-        self.interval = Interval.objects.create(
+        cls.interval = Interval.objects.create(
             external_id="INT1",
             parent=None,
             name="int1",
@@ -97,29 +104,29 @@ class SignalAPITestCase(APITestCase):
         )
 
         # Create a cell *without* assay
-        self.cell = Cell.objects.create(
+        cls.cell = Cell.objects.create(
             name='CGTAGCTTCG',
             x_coordinate=100,
             y_coordinate=200,
             z_coordinate=50,
         )
 
-        self.base_url    = reverse('signal-list')
-        self.api_payload = {
+        cls.base_url    = SIGNAL_LIST_URL
+        cls.api_payload = {
             'signal':     500,
             'p_value':    None,
             'padj_value': None,
-            'assay':      self.assay.pk,
-            'interval':   self.interval.pk,
-            'cell':       self.cell.pk,
+            'assay':      cls.assay.pk,
+            'interval':   cls.interval.pk,
+            'cell':       cls.cell.pk,
         }
-        self.orm_payload = {
+        cls.orm_payload = {
             'signal':     500,
             'p_value':    None,
             'padj_value': None,
-            'assay':      self.assay,
-            'interval':   self.interval,
-            'cell':       self.cell,
+            'assay':      cls.assay,
+            'interval':   cls.interval,
+            'cell':       cls.cell,
         }
 
     def test_create_signal(self):
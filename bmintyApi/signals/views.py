@@ -1,26 +1,70 @@
 from rest_framework import generics
+from rest_framework.response import Response
 from .models      import Cell, Signal
 from .serializers import CellSerializer, SignalSerializer
+from bmintyApi.conditional import conditional_detail
+
+# Rows fetched per round trip when an unpaginated list is streamed with .iterator()
+LIST_CHUNK_SIZE = 2000
+
 
 # --- Cell Endpoints ---
 
 class CellListAPIView(generics.ListAPIView):
-    queryset         = Cell.objects.all()
+    # Load only the columns the serializer renders
+    queryset         = Cell.objects.only(*CellSerializer.Meta.fields)
     serializer_class = CellSerializer
 
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        # Unpaginated: stream the rows instead of caching every Cell instance first
+        serializer = self.get_serializer(queryset.iterator(chunk_size=LIST_CHUNK_SIZE), many=True)
+        return Response(serializer.data)
+
 class CellDetailAPIView(generics.RetrieveAPIView):
-    queryset         = Cell.objects.all()
+    queryset         = Cell.objects.only(*CellSerializer.Meta.fields)
     serializer_class = CellSerializer
     lookup_field     = 'cell_id'
 
+    @conditional_detail(queryset, 'cell_id')
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
 
 # --- Signal Endpoints ---
 
+# SignalSerializer's fields, and the columns they are read from
+SIGNAL_LIST_FIELDS  = ('id', 'signal', 'p_value', 'padj_value', 'assay', 'interval', 'cell')
+SIGNAL_LIST_COLUMNS = ('id', 'signal', 'p_value', 'padj_value', 'assay_id', 'interval_id', 'cell_id')
+
 class SignalListAPIView(generics.ListAPIView):
     queryset         = Signal.objects.all()
     serializer_class = SignalSerializer
 
+    def list(self, request, *args, **kwargs):
+        # Every field is a number or an FK id, so rows are built straight from
+        # values_list instead of running SignalSerializer per object
+        queryset = self.filter_queryset(self.get_queryset()).values_list(*SIGNAL_LIST_COLUMNS)
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            # Unpaginated: stream the rows instead of caching the whole result first
+            page_rows = queryset.iterator(chunk_size=LIST_CHUNK_SIZE)
+        else:
+            page_rows = page
+        rows = [dict(zip(SIGNAL_LIST_FIELDS, row)) for row in page_rows]
+        if page is not None:
+            return self.get_paginated_response(rows)
+        return Response(rows)
+
 class SignalDetailAPIView(generics.RetrieveAPIView):
-    queryset         = Signal.objects.all()
+    queryset         = Signal.objects.only(*SignalSerializer.Meta.fields)
     serializer_class = SignalSerializer
     lookup_field     = 'signal_id'
+
+    @conditional_detail(queryset, 'signal_id')
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
@@ -0,0 +1,72 @@
+import string
+
+import django_filters
+from django import forms
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.db.models.lookups import In
+from django_filters.constants import EMPTY_VALUES
+
+from .models import Study
+
+# SQLite's LOWER() folds ASCII letters only, as does the LIKE that __iexact compiles to
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def iexact_any(field, values):
+    """
+    Q matching rows whose `field` equals any of `values`, case-insensitively, as a single
+    LOWER(field) IN (...) lookup rather than an OR of LIKEs; it can use an index on
+    LOWER(field). Shared by the study list and the filtered exports in databasemanager.
+    """
+    return Q(In(Lower(field), list(dict.fromkeys(str(v).translate(_ASCII_LOWER) for v in values))))
+
+
+class ArrayOrSingleWidget(forms.Widget):
+    """
+    Read a filter value as a list from either 'name[]' (array format) or 'name'.
+    'name[]' takes precedence; blank values are dropped and the rest stripped, as in
+    the study list's other multi-value params.
+    """
+
+    def value_from_datadict(self, data, files, name):
+        array_name = name + '[]'
+        if array_name in data:
+            return [v.strip() for v in data.getlist(array_name) if v and v.strip()]
+        value = data.get(name)
+        return [value.strip()] if value and value.strip() else []
+
+
+class MultiValueField(forms.Field):
+    widget = ArrayOrSingleWidget
+
+
+class MultiValueFilter(django_filters.Filter):
+    """Match rows where `field_name`__`lookup_expr` holds for any of the given values."""
+
+    field_class = MultiValueField
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        if self.lookup_expr == 'iexact':
+            return self.get_method(qs)(iexact_any(self.field_name, value))
+        lookup = '%s__%s' % (self.field_name, self.lookup_expr)
+        value_q = Q()
+        for v in value:
+            value_q |= Q(**{lookup: v})
+        return self.get_method(qs)(value_q)
+
+
+class StudyFilterSet(django_filters.FilterSet):
+    """Study-level filters of the study list; assay, cell and genomic filters live in the view."""
+
+    study_name        = MultiValueFilter(field_name='name', lookup_expr='iexact')
+    study_external_id = MultiValueFilter(field_name='external_id', lookup_expr='iexact')
+    study_repository  = MultiValueFilter(field_name='external_repo', lookup_expr='icontains')
+    study_description = MultiValueFilter(field_name='description', lookup_expr='icontains')
+    study_note        = MultiValueFilter(field_name='note', lookup_expr='icontains')
+
+    class Meta:
+        model  = Study
+        fields = []
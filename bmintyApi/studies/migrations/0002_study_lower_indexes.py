@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:09
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('studies', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='study',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='idx_study_name_lower'),
+        ),
+        migrations.AddIndex(
+            model_name='study',
+            index=models.Index(django.db.models.functions.text.Lower('external_id'), name='idx_study_external_id_lower'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 
 class Study(models.Model):
     external_id   = models.CharField(max_length=100, unique=True)
@@ -11,6 +12,11 @@ class Study(models.Model):
     class Meta:
         db_table  = 'study'
         ordering = ['id']   # or ['name'], or whatever makes sense
+        indexes = [
+            # For the study list's case-insensitive name/ID filters (LOWER(col) IN (...))
+            models.Index(Lower('name'), name='idx_study_name_lower'),
+            models.Index(Lower('external_id'), name='idx_study_external_id_lower'),
+        ]
 
     def __str__(self):
         return self.name
@@ -1,6 +1,8 @@
 from django.test import TestCase
 from django.db.models import Count
+from django.urls import reverse
 from rest_framework import status, generics
+from rest_framework.test import APITestCase
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
@@ -10,6 +12,7 @@ from assay.models    import Assay
 from interval.models import Interval
 from signals.models  import Signal
 from assembly.models import Assembly
+from pipelines.models import Pipeline
 
 
 class StudyListCreateView(generics.ListCreateAPIView):
@@ -125,3 +128,108 @@ class StudyExploreAPIView(APIView):
         }
         serializer = StudyExploreSerializer(payload)
         return Response(serializer.data)
+
+
+class StudyListFilterTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # one study whose assay has a signal on a protein-coding gene of hg38
+        cls.study = Study.objects.create(
+            external_id='ext1',
+            external_repo='repo1',
+            name='Study One',
+            description='First',
+            availability=True
+        )
+        assembly = Assembly.objects.create(name='hg38', version='GRCh38', species='Homo sapiens')
+        pipeline = Pipeline.objects.create(name='pipe', external_url='http://example.org')
+        assay = Assay.objects.create(
+            external_id='as1',
+            type='RNA-seq',
+            name='Assay One',
+            study=cls.study,
+            pipeline=pipeline,
+            assemblies=str(assembly.id),
+        )
+        interval = Interval.objects.create(
+            external_id='gene1',
+            type='gene',
+            biotype='protein_coding',
+            chromosome='chr1',
+            start=100,
+            end=200,
+            strand='+',
+            assembly=assembly,
+        )
+        Signal.objects.create(signal=1.5, assay=assay, interval=interval)
+        cls.url = reverse('study-list-create')
+
+    def list_studies(self, params):
+        resp = self.client.get(self.url, params)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        return resp.data['results']
+
+    def test_matching_interval_and_assembly_filters(self):
+        for params in ({'interval_type': 'gene'}, {'biotype': 'protein_coding'},
+                       {'assembly_name': 'hg38'}):
+            results = self.list_studies(params)
+            self.assertEqual([s['id'] for s in results], [self.study.id], params)
+
+    def test_unmatched_interval_type_returns_empty_list(self):
+        self.assertEqual(self.list_studies({'interval_type': 'enhancer'}), [])
+
+    def test_unmatched_biotype_returns_empty_list(self):
+        self.assertEqual(self.list_studies({'biotype': 'lncRNA'}), [])
+
+    def test_unmatched_assembly_returns_empty_list(self):
+        self.assertEqual(self.list_studies({'assembly_name': 'mm10'}), [])
+
+
+class StudyListNoCountTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # 25 studies: pages of 10, 10 and 5
+        cls.studies = Study.objects.bulk_create(
+            Study(external_id=f'ext{i}', external_repo='repo', name=f'Study {i}',
+                  description='', availability=True)
+            for i in range(25)
+        )
+        cls.url = reverse('study-list-create')
+
+    def get_page(self, page=None):
+        params = {'no_count': '1', 'page_size': 10}
+        if page is not None:
+            params['page'] = page
+        return self.client.get(self.url, params)
+
+    def test_first_page(self):
+        resp = self.get_page()
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertIsNone(resp.data['count'])
+        self.assertEqual([s['id'] for s in resp.data['results']], [s.id for s in self.studies[:10]])
+        self.assertIn('page=2', resp.data['next'])
+        self.assertIsNone(resp.data['previous'])
+
+    def test_middle_page(self):
+        resp = self.get_page(2)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual([s['id'] for s in resp.data['results']], [s.id for s in self.studies[10:20]])
+        self.assertIn('page=3', resp.data['next'])
+        # the link back to page 1 drops the page param
+        self.assertIsNotNone(resp.data['previous'])
+        self.assertNotIn('page=', resp.data['previous'].replace('page_size=', ''))
+
+    def test_last_page_has_no_next(self):
+        resp = self.get_page(3)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual([s['id'] for s in resp.data['results']], [s.id for s in self.studies[20:]])
+        self.assertIsNone(resp.data['next'])
+        self.assertIn('page=2', resp.data['previous'])
+
+    def test_page_last_is_rejected(self):
+        # 'last' needs the count that no_count skips
+        self.assertEqual(self.get_page('last').status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_out_of_range_page(self):
+        self.assertEqual(self.get_page(4).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.get_page(0).status_code, status.HTTP_404_NOT_FOUND)
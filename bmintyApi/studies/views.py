@@ -1,46 +1,120 @@
+import hashlib
+from itertools import groupby
+from operator import itemgetter
+from types import MappingProxyType
+
 from django.shortcuts import render
-from django.db.models import Count, Q, Prefetch, F
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
+from django.db.models import Count, Exists, IntegerField, OuterRef, Q, Prefetch, F, Subquery, Value
+from django.db.models.functions import Coalesce
 from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from django_filters.rest_framework import DjangoFilterBackend
 
 from .models       import Study
+from .filters      import StudyFilterSet, iexact_any
 from .serializers  import (
     StudySerializer,
     StudyExploreSerializer,
     StudyAssaySerializer,
     AssayDetailSerializer,
     StudyListSerializer,
+    AssemblySerializer,
 )
 from bmintyApi.pagination import CustomPageNumberPagination
 from assembly.models      import Assembly
 from assay.models         import Assay
 from interval.models      import Interval
 from signals.models       import Signal, Cell
+from databasemanager.models import current_data_version
 
 import logging
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when explore aggregates are streamed with .iterator()
+EXPLORE_CHUNK_SIZE = 2000
+
+
+# Accepted spellings of the study/assay availability filters
+_BOOL_MAP = MappingProxyType({
+    '1': True, 'true': True, 'yes': True, 'available': True, 't': True, 'on': True,
+    '0': False, 'false': False, 'no': False, 'unavailable': False, 'f': False, 'off': False,
+})
+
+# Study-list query param -> Assay lookup for the assay-level filters
+_ASSAY_LOOKUPS = MappingProxyType({
+    'assay_name':        'name__iexact',
+    'assay_external_id': 'external_id__iexact',
+    'assay_type':        'type__iexact',
+    'tissue':            'tissue__iexact',
+    'assay_target':      'target__icontains',
+    'assay_date':        'date__icontains',
+    'assay_kit':         'kit__icontains',
+    'assay_cell_type':   'cell_type__iexact',  # Assay.cell_type metadata field
+    'treatment':         'treatment__iexact',
+    'assay_description': 'description__icontains',
+    'assay_note':        'note__icontains',
+    'platform':          'platform__iexact',
+})
+
+# Alternative cell_type/cell_kind spellings -> Cell.type
+_CELL_TYPE_ALIASES = MappingProxyType({
+    'single cell': 'cell',
+    'single-cell': 'cell',
+    'singlecell':  'cell',
+    'srt':         'spot',
+})
+
+# Study-list query param -> Assembly field for the assembly filters
+_ASSEMBLY_FILTERS = MappingProxyType({
+    'assembly_name':    'name',
+    'assembly_version': 'version',
+    'assembly_species': 'species',
+})
 
-def _get_multi_value_param(query_params, param_name):
+
+def _parse_bool(val):
+    """True/False for a recognised availability value, None otherwise (or for None)."""
+    if val is None:
+        return None
+    return _BOOL_MAP.get(str(val).lower())
+
+
+def _assays_with_signals_on(intervals):
+    """Ids of the assays that have at least one signal on an interval in `intervals`."""
+    return list(
+        Assay.objects.filter(
+            Exists(Signal.objects.filter(assay=OuterRef('pk'), interval__in=intervals))
+        ).values_list('id', flat=True)
+    )
+
+
+def _parse_multi_value_params(query_params):
     """
-    Get parameter values, handling both array format (param_name[]) and single values.
-    Returns a list of values, filtering out empty or whitespace-only strings.
+    Parse every query parameter once into {param_name: [values]}, handling both array
+    format (param_name[]) and single values. 'param_name[]' takes precedence over
+    'param_name'; empty or whitespace-only strings are dropped.
     """
-    # Check for array format: param_name[]
-    array_values = query_params.getlist(f'{param_name}[]')
-    if array_values:
-        # Filter out empty/whitespace strings
-        return [v.strip() for v in array_values if v and v.strip()]
-    
-    # Check for single value
-    single_value = query_params.get(param_name)
-    if single_value and single_value.strip():
-        return [single_value.strip()]
-    
-    return []
+    parsed = {}
+    arrays = []
+    for key, values in query_params.lists():
+        if key.endswith('[]'):
+            arrays.append((key[:-2], values))
+            continue
+        # A repeated single parameter keeps its last value, as QueryDict.get does
+        single_value = values[-1] if values else None
+        if single_value and single_value.strip():
+            parsed[key] = [single_value.strip()]
+    for param_name, array_values in arrays:
+        if array_values:
+            parsed[param_name] = [v.strip() for v in array_values if v and v.strip()]
+    return parsed
 
 
 class StudyListCreateView(generics.ListCreateAPIView):
@@ -81,6 +155,7 @@ class StudyListCreateView(generics.ListCreateAPIView):
     **Pagination:**
     - page: Page number (default: 1)
     - page_size: Items per page (default: 10)
+    - no_count: 1 to skip counting the matching studies ('count' is then null)
     
     **Example:**
     /api/studies/?tissue=lung&assay_type=scRNA-seq&page=1&page_size=20
@@ -102,6 +177,8 @@ class StudyListCreateView(generics.ListCreateAPIView):
     """
     queryset         = Study.objects.all()
     pagination_class = CustomPageNumberPagination
+    filter_backends  = [DjangoFilterBackend]
+    filterset_class  = StudyFilterSet
 
     def get_serializer_class(self):
         return StudyListSerializer if self.request.method == 'GET' else StudySerializer
@@ -109,237 +186,157 @@ class StudyListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         qs     = super().get_queryset()
         params = self.request.query_params
+        multi_params = _parse_multi_value_params(params)
+
+        # Study name/ID/repository/description/note filters: StudyFilterSet, applied by
+        # DjangoFilterBackend in filter_queryset()
 
-        def parse_bool(val):
-            if val is None:
-                return None
-            v = str(val).lower()
-            if v in ('1', 'true', 'yes', 'available', 't', 'on'):
-                return True
-            if v in ('0', 'false', 'no', 'unavailable', 'f', 'off'):
-                return False
-            return None
-
-        # — Study‐level filters (handles both single values and arrays) —
-        study_names = _get_multi_value_param(params, 'study_name')
-        if study_names:
-            name_q = Q()
-            for name in study_names:
-                name_q |= Q(name__iexact=name)
-            qs = qs.filter(name_q)
-        
-        study_external_ids = _get_multi_value_param(params, 'study_external_id')
-        if study_external_ids:
-            ext_id_q = Q()
-            for ext_id in study_external_ids:
-                ext_id_q |= Q(external_id__iexact=ext_id)
-            qs = qs.filter(ext_id_q)
-        
-        study_repositories = _get_multi_value_param(params, 'study_repository')
-        if study_repositories:
-            repo_q = Q()
-            for repo in study_repositories:
-                repo_q |= Q(external_repo__icontains=repo)
-            qs = qs.filter(repo_q)
-        
-        study_descriptions = _get_multi_value_param(params, 'study_description')
-        if study_descriptions:
-            desc_q = Q()
-            for desc in study_descriptions:
-                desc_q |= Q(description__icontains=desc)
-            qs = qs.filter(desc_q)
-        
-        study_notes = _get_multi_value_param(params, 'study_note')
-        if study_notes:
-            note_q = Q()
-            for note in study_notes:
-                note_q |= Q(note__icontains=note)
-            qs = qs.filter(note_q)
-        
         # Study availability filter - default to True (only show available studies) when not specified
         if 'study_availability' in params or 'study_availability[]' in params:
-            sval = parse_bool(params.get('study_availability') or params.get('study_availability[]'))
+            sval = _parse_bool(params.get('study_availability') or params.get('study_availability[]'))
             if sval is not None:
                 qs = qs.filter(availability=sval)
         else:
             # Default: only show available studies
             qs = qs.filter(availability=True)
 
+        # Set by every filter below that joins assay rows, which can repeat a study
+        joins_assays = False
+
         # — Assay‐level filters narrow which studies appear —
-        ASSAY_LOOKUPS = {
-          'assay_name':        'name__iexact',
-          'assay_external_id': 'external_id__iexact',
-          'assay_type':        'type__iexact',
-          'tissue':            'tissue__iexact',
-          'assay_target':      'target__icontains',
-          'assay_date':        'date__icontains',
-          'assay_kit':         'kit__icontains',
-          'assay_cell_type':   'cell_type__iexact',  # Assay.cell_type metadata field
-          'treatment':         'treatment__iexact',
-          'assay_description': 'description__icontains',
-          'assay_note':        'note__icontains',
-          'platform':          'platform__iexact',
-        }
         assay_q = Assay.objects.all()
         assay_filters_applied = False
         
         # Parse assay_availability filter early so we can use it for both filtering and annotation
         raw_av = params.get('assay_availability') or params.get('assay_availability[]')
-        assay_availability_filter = parse_bool(raw_av)
+        assay_availability_filter = _parse_bool(raw_av)
         
-        for p, lookup in ASSAY_LOOKUPS.items():
-            values = _get_multi_value_param(params, p)
+        for p, lookup in _ASSAY_LOOKUPS.items():
+            values = multi_params.get(p, ())
             if values:
                 assay_filters_applied = True
-                value_q = Q()
-                for v in values:
-                    value_q |= Q(**{lookup: v})
+                field, _, lookup_type = lookup.rpartition('__')
+                if lookup_type == 'iexact':
+                    value_q = iexact_any(field, values)
+                else:
+                    value_q = Q()
+                    for v in values:
+                        value_q |= Q(**{lookup: v})
                 assay_q = assay_q.filter(value_q)
         
         if assay_availability_filter is not None:
             assay_filters_applied = True
             assay_q = assay_q.filter(availability=assay_availability_filter)
         
+        # A correlated EXISTS on the study's assays (assay_study_id index) needs no
+        # study→assay join, so on its own it cannot repeat a study
         if assay_filters_applied:
-            qs = qs.filter(assays__in=assay_q).distinct()
+            qs = qs.filter(Exists(assay_q.filter(study=OuterRef('pk'))))
 
         # — Cell-level filters (Cell.type and Cell.label, NOT Assay.cell_type) —
-        # Note: 'cell_type' in ASSAY_LOOKUPS above refers to Assay.cell_type (assay metadata)
+        # Note: 'assay_cell_type' in _ASSAY_LOOKUPS refers to Assay.cell_type (assay metadata)
         # For filtering by actual Cell objects, we need separate handling
         # OPTIMIZATION: Query cells first to get assay_ids, then filter studies by those assays
         
+        cell_q = Q()
         # Support both 'cell_type' and legacy 'cell_kind' for Cell.type filtering
-        cell_types = _get_multi_value_param(params, 'cell_type')
+        cell_types = multi_params.get('cell_type', ())
         if not cell_types:
-            cell_types = _get_multi_value_param(params, 'cell_kind')
+            cell_types = multi_params.get('cell_kind', ())
         
         if cell_types:
             # Normalize cell type values
-            normalized_types = []
-            for kind in cell_types:
-                k = (kind or '').strip().lower()
-                if k in ('single cell', 'single-cell', 'singlecell'):
-                    k = 'cell'
-                elif k == 'srt':
-                    k = 'spot'
-                normalized_types.append(k)
-            
-            # OPTIMIZED: Query Cell table directly to get assay_ids with matching cells
-            # This avoids the expensive study→assay→cell join
-            cell_type_q = Q()
-            for k in normalized_types:
-                cell_type_q |= Q(type__iexact=k)
-            matching_assay_ids = Cell.objects.filter(cell_type_q).values_list('assay_id', flat=True).distinct()
-            qs = qs.filter(assays__id__in=matching_assay_ids)
+            normalized_types = [
+                _CELL_TYPE_ALIASES.get(k, k)
+                for k in ((kind or '').strip().lower() for kind in cell_types)
+            ]
+
+            cell_q &= iexact_any('type', normalized_types)
         
-        cell_labels = _get_multi_value_param(params, 'cell_label')
+        cell_labels = multi_params.get('cell_label', ())
         if cell_labels:
-            # OPTIMIZED: Query Cell table directly to get assay_ids with matching labels
-            label_q = Q()
-            for lbl in cell_labels:
-                label_q |= Q(label__iexact=lbl)
-            matching_assay_ids = Cell.objects.filter(label_q).values_list('assay_id', flat=True).distinct()
+            cell_q &= iexact_any('label', cell_labels)
+
+        # One Cell filter for both, so type and label must hold for the same cell. As for
+        # the interval filters below, it runs as an EXISTS per assay (probing
+        # idx_cell_assay_type and stopping at the first matching cell) rather than a
+        # DISTINCT over every matching cell's assay_id
+        if cell_q:
+            matching_assay_ids = list(
+                Assay.objects.filter(
+                    Exists(Cell.objects.filter(cell_q, assay=OuterRef('pk')))
+                ).values_list('id', flat=True)
+            )
+            if not matching_assay_ids:
+                return Study.objects.none().order_by('id')
             qs = qs.filter(assays__id__in=matching_assay_ids)
+            joins_assays = True
 
-        # — Interval filters - OPTIMIZED: Get assay IDs from signals table first —
-        # Instead of going study→assay→signal→interval (scanning millions of signals),
-        # we query signal table directly to find assay_ids with matching intervals
-        interval_types = _get_multi_value_param(params, 'interval_type')
+        # — Interval filters: assays with at least one signal on a matching interval —
+        # interval_type and biotype combine into one Interval filter (both must hold for
+        # the same interval) resolved by one EXISTS query; SQLite probes
+        # idx_signal_assay_interval per assay and stops at the first hit, so no interval
+        # or signal ids reach Python.
+        interval_q = Q()
+        interval_types = multi_params.get('interval_type', ())
         if interval_types:
-            # Step 1: Get interval IDs matching the type filter
-            type_q = Q()
-            for itype in interval_types:
-                type_q |= Q(type__iexact=itype)
-            matching_interval_ids = list(Interval.objects.filter(type_q).values_list('id', flat=True))
-            
-            if matching_interval_ids:
-                # Step 2: Get distinct assay_ids from signals that reference these intervals
-                # This uses the idx_signal_interval_id index and is much faster
-                # CHUNKING: SQLite has a limit of 999 SQL variables, so chunk the IDs
-                chunk_size = 999
-                all_assay_ids = set()
-                for i in range(0, len(matching_interval_ids), chunk_size):
-                    chunk = matching_interval_ids[i:i + chunk_size]
-                    chunk_assay_ids = Signal.objects.filter(
-                        interval_id__in=chunk
-                    ).values_list('assay_id', flat=True).distinct()
-                    all_assay_ids.update(chunk_assay_ids)
-                
-                if all_assay_ids:
-                    qs = qs.filter(assays__id__in=all_assay_ids)
-        
-        biotypes = _get_multi_value_param(params, 'biotype')
+            interval_q &= iexact_any('type', interval_types)
+        biotypes = multi_params.get('biotype', ())
         if biotypes:
-            # Step 1: Get interval IDs matching the biotype filter
-            biotype_q = Q()
-            for bio in biotypes:
-                biotype_q |= Q(biotype__iexact=bio)
-            matching_interval_ids = list(Interval.objects.filter(biotype_q).values_list('id', flat=True))
-            
-            if matching_interval_ids:
-                # Step 2: Get distinct assay_ids from signals that reference these intervals
-                # CHUNKING: SQLite has a limit of 999 SQL variables, so chunk the IDs
-                chunk_size = 999
-                all_assay_ids = set()
-                for i in range(0, len(matching_interval_ids), chunk_size):
-                    chunk = matching_interval_ids[i:i + chunk_size]
-                    chunk_assay_ids = Signal.objects.filter(
-                        interval_id__in=chunk
-                    ).values_list('assay_id', flat=True).distinct()
-                    all_assay_ids.update(chunk_assay_ids)
-                
-                if all_assay_ids:
-                    qs = qs.filter(assays__id__in=all_assay_ids)
-        
-        # Assembly filters - OPTIMIZED to use CSV assemblies field instead of expensive joins
-        assembly_names = _get_multi_value_param(params, 'assembly_name')
-        if assembly_names:
-            # Look up assembly IDs matching the names
-            assembly_ids = Assembly.objects.filter(
-                name__in=assembly_names
-            ).values_list('id', flat=True)
-            if assembly_ids:
-                # Build regex pattern to match any of these IDs in CSV field on Assay
-                id_pattern = '|'.join([f'(^{id}$|^{id},|,{id},|,{id}$)' for id in assembly_ids])
-                qs = qs.filter(assays__assemblies__regex=id_pattern)
-        
-        assembly_versions = _get_multi_value_param(params, 'assembly_version')
-        if assembly_versions:
-            # Look up assembly IDs matching the versions
-            assembly_ids = Assembly.objects.filter(
-                version__in=assembly_versions
-            ).values_list('id', flat=True)
-            if assembly_ids:
-                id_pattern = '|'.join([f'(^{id}$|^{id},|,{id},|,{id}$)' for id in assembly_ids])
-                qs = qs.filter(assays__assemblies__regex=id_pattern)
+            interval_q &= iexact_any('biotype', biotypes)
+        if interval_q:
+            matching_assay_ids = _assays_with_signals_on(Interval.objects.filter(interval_q))
+            if not matching_assay_ids:
+                return Study.objects.none().order_by('id')
+            qs = qs.filter(assays__id__in=matching_assay_ids)
+            joins_assays = True
         
-        assembly_species = _get_multi_value_param(params, 'assembly_species')
-        if assembly_species:
-            # Look up assembly IDs matching the species
-            assembly_ids = Assembly.objects.filter(
-                species__in=assembly_species
-            ).values_list('id', flat=True)
-            if assembly_ids:
-                id_pattern = '|'.join([f'(^{id}$|^{id},|,{id},|,{id}$)' for id in assembly_ids])
-                qs = qs.filter(assays__assemblies__regex=id_pattern)
+        # Assembly filters - join the indexed assay_assembly mirror of the assemblies CSV.
+        # One query finds the assemblies matching any of them; each filter then gets its
+        # own ids. A filter value that names no assembly (like an interval filter that
+        # matches no assay) can only produce an empty page, so the remaining filters and
+        # the assay_count annotation are skipped.
+        assembly_values = {
+            field: set(multi_params[param])
+            for param, field in _ASSEMBLY_FILTERS.items()
+            if multi_params.get(param)
+        }
+        if assembly_values:
+            any_assembly_q = Q()
+            for field, values in assembly_values.items():
+                any_assembly_q |= Q(**{f'{field}__in': values})
+            assembly_ids = {field: [] for field in assembly_values}
+            for assembly_id, *row in Assembly.objects.filter(any_assembly_q).values_list('id', *assembly_values):
+                for (field, values), value in zip(assembly_values.items(), row):
+                    if value in values:
+                        assembly_ids[field].append(assembly_id)
+            for ids in assembly_ids.values():
+                if not ids:
+                    return Study.objects.none().order_by('id')
+                qs = qs.filter(assays__assembly_refs__in=ids)
+                joins_assays = True
 
         # — Finally annotate assay_count —
-        # Respect the assay_availability filter to show counts matching what user is filtering for
-        if assay_availability_filter is True:
-            # When filtering for available assays, count only available ones
-            qs = qs.annotate(
-                assay_count=Count('assays', filter=Q(assays__availability=True), distinct=True)
-            )
-        elif assay_availability_filter is False:
-            # When filtering for unavailable assays, count only unavailable ones
-            qs = qs.annotate(
-                assay_count=Count('assays', filter=Q(assays__availability=False), distinct=True)
-            )
-        else:
-            # Default when no availability filter: count only available assays
-            qs = qs.annotate(
-                assay_count=Count('assays', filter=Q(assays__availability=True), distinct=True)
-            )
+        # Counted per study by a correlated subquery on the assay_study_id index rather
+        # than COUNT(DISTINCT) over the join rows multiplied by the filters above.
+        # Respect the assay_availability filter (unavailable only when asked for,
+        # available otherwise) so counts match what the user is filtering for.
+        counted_availability = assay_availability_filter is not False
+        assay_count_sq = Subquery(
+            Assay.objects
+                .filter(study=OuterRef('pk'), availability=counted_availability)
+                .order_by()
+                .values('study')
+                .annotate(c=Count('*'))
+                .values('c')
+        )
+        # Collapse the joined filters to a set of study ids instead of a DISTINCT over
+        # every selected column: that would compare the description/note TEXT and run
+        # assay_count for each joined row, once for the page and again in the
+        # paginator's COUNT(*), which here reads no columns at all
+        if joins_assays:
+            qs = Study.objects.filter(id__in=qs.values('id'))
+        qs = qs.annotate(assay_count=Coalesce(assay_count_sq, 0))
         
         # Default ordering by study ID ascending
         return qs.order_by('id')
@@ -412,11 +409,36 @@ class StudyChangeStatus(APIView):
 
         if not study.availability and new_avail is False:
             return Response({'message': 'Study is already deactivated.'})    
+
+
+def _explore_etag(request, pk):
+    """
+    ETag for a study's explore payload: a digest of the study row, its assay rows and
+    the data version, which every import path and ORM write bumps (so new signals,
+    cells, intervals or assemblies change it too). Three indexed lookups, none of them
+    over the study's signals. None (no ETag, the view 404s) for an unknown study.
+    """
+    study_row = Study.objects.filter(pk=pk).values_list().first()
+    if study_row is None:
+        return None
+    digest = hashlib.sha256(repr(study_row).encode())
+    for assay_row in Assay.objects.filter(study_id=pk).order_by('id').values_list():
+        digest.update(repr(assay_row).encode())
+    digest.update(repr(current_data_version()).encode())
+    return digest.hexdigest()[:32]
+
+
 class StudyExploreAPIView(APIView):
     """
     GET /api/studies/{study_id}/explore/
     Now returns assemblies, assays, interval_counts, cell_count, peak_count
+
+    Clients revalidate with If-None-Match and get a 304 without the aggregate queries
+    while the study, its assays and the data version are unchanged.
     """
+    @method_decorator(cache_control(no_cache=True))
+    @method_decorator(condition(etag_func=_explore_etag))
+    @method_decorator(vary_on_headers('Accept'))
     def get(self, request, pk):
         # 1) fetch or 404
         try:
@@ -424,40 +446,65 @@ class StudyExploreAPIView(APIView):
         except Study.DoesNotExist:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        # 2) intervals via signals→assay→study
-        intervals = Interval.objects.filter(
-            signals__assays__study=study
-        ).distinct()
+        # 2) + 3) + 5) the study's intervals (those with a signal from its assays, as a
+        #    correlated EXISTS that stops at the first matching signal per interval: a
+        #    join plus DISTINCT would put interval.id in the GROUP BY), counted once per
+        #    (type, biotype, assembly). Both the assemblies and interval_counts come
+        #    from this one grouped query, streamed as it arrives. Ordering by the
+        #    grouping prefix lets each type's rows be folded as one contiguous run
+        interval_groups = (
+            Interval.objects.filter(
+                Exists(Signal.objects.filter(interval=OuterRef('pk'), assay__study=study))
+            )
+            .values('type', 'biotype', 'assembly_id')
+            .annotate(count=Count('pk'))
+            .order_by('type', 'biotype')
+        )
+        assembly_ids = set()
+        interval_counts = {}
+        rows = interval_groups.iterator(chunk_size=EXPLORE_CHUNK_SIZE)
+        for interval_type, type_rows in groupby(rows, key=itemgetter('type')):
+            # A biotype spans one row per assembly, and None and '' count under ''
+            counts = interval_counts[interval_type] = {}
+            for row in type_rows:
+                assembly_ids.add(row['assembly_id'])
+                b = row['biotype'] or ''
+                counts[b] = counts.get(b, 0) + row['count']
 
-        # 3) assemblies
-        assembly_ids = intervals.values_list('assembly_id', flat=True).distinct()
-        assemblies   = Assembly.objects.filter(assembly_id__in=assembly_ids,
-                                               availability=True)
+        assemblies = Assembly.objects.filter(id__in=assembly_ids).only(*AssemblySerializer.Meta.fields)
 
-        # 4) assays for study
+        # 4) assays for study. AssayWithStudyCountSerializer has no nested relations
+        #    (study and pipeline render as their FK ids), so nothing to prefetch; every
+        #    assay here belongs to exactly this study, so study_count needs no GROUP BY
         assays = (
             Assay.objects
-                .filter(availability=True)
-                .annotate(study_count=Count('study', distinct=True))
-                .filter(study=study)
+                .filter(availability=True, study=study)
+                .annotate(study_count=Value(1, output_field=IntegerField()))
         )
 
-        # 5) interval_counts
-        qs = intervals.values('type', 'biotype').annotate(count=Count('pk'))
-        interval_counts = {}
-        for row in qs:
-            t = row['type']
-            b = row['biotype'] or ''
-            interval_counts.setdefault(t, {})[b] = row['count']
-
-        # 6) cell_count & peak_count
-        cell_count = Signal.objects.filter(
-            assays__study=study
-        ).values('cell').distinct().count()
-
-        peak_count = Signal.objects.filter(
-            assays__study=study
-        ).count()
+        # 6) cell_count & peak_count, fetched together as two scalar subqueries. Cells
+        #    are counted on the cell table through its assay FK instead of DISTINCT over
+        #    the study's signals (cells without signals are removed on import)
+        study_counts = Study.objects.filter(pk=study.pk).values(
+            cell_count=Coalesce(Subquery(
+                Cell.objects
+                    .filter(assay__study=OuterRef('pk'))
+                    .order_by()
+                    .values('assay__study')
+                    .annotate(c=Count('*'))
+                    .values('c')
+            ), 0),
+            peak_count=Coalesce(Subquery(
+                Signal.objects
+                    .filter(assay__study=OuterRef('pk'))
+                    .order_by()
+                    .values('assay__study')
+                    .annotate(c=Count('*'))
+                    .values('c')
+            ), 0),
+        ).get()
+        cell_count = study_counts['cell_count']
+        peak_count = study_counts['peak_count']
 
         payload = {
             'assemblies':      assemblies,